@@ -0,0 +1,39 @@
+"""Add subdivision path indexes
+
+Revision ID: d3e969d1960a
+Revises: d1b96cc0d989
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3e969d1960a"
+down_revision: Union[str, None] = "d1b96cc0d989"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_subdivision_path_gist",
+        "subdivision",
+        ["path"],
+        unique=False,
+        postgresql_using="gist",
+    )
+    op.create_index(
+        "ix_subdivision_company_id_path",
+        "subdivision",
+        ["company_id", "path"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_subdivision_company_id_path", table_name="subdivision")
+    op.drop_index("ix_subdivision_path_gist", table_name="subdivision")
@@ -0,0 +1,54 @@
+"""Add subdivision stats
+
+Revision ID: 32fb88cc27cf
+Revises: d3e969d1960a
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "32fb88cc27cf"
+down_revision: Union[str, None] = "d3e969d1960a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "subdivision_stats",
+        sa.Column("subdivision_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "positions_count", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column(
+            "headcount", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("TIMEZONE('utc', now())"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["subdivision_id"], ["subdivision.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("subdivision_id"),
+    )
+    op.execute(
+        "INSERT INTO subdivision_stats "
+        "(subdivision_id, positions_count, headcount) "
+        "SELECT p.subdivision_id, count(DISTINCT p.id), count(pa.id) "
+        "FROM position AS p "
+        "LEFT JOIN position_assignment AS pa ON pa.position_id = p.id "
+        "GROUP BY p.subdivision_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("subdivision_stats")
@@ -0,0 +1,31 @@
+"""Add position keyset index
+
+Revision ID: 5c1e7a9d2b43
+Revises: 32fb88cc27cf
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e7a9d2b43"
+down_revision: Union[str, None] = "32fb88cc27cf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_position_subdivision_id_title_id",
+        "position",
+        ["subdivision_id", "title", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_position_subdivision_id_title_id", table_name="position")
@@ -0,0 +1,33 @@
+"""Add user keyset index
+
+Revision ID: 8e4b2f61c0a7
+Revises: 5c1e7a9d2b43
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4b2f61c0a7"
+down_revision: Union[str, None] = "5c1e7a9d2b43"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_company_id_last_name_first_name_id",
+        "user",
+        ["company_id", "last_name", "first_name", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_company_id_last_name_first_name_id", table_name="user"
+    )
@@ -0,0 +1,43 @@
+"""Add user lower unique indexes
+
+Revision ID: c4f81b06e9d5
+Revises: a7d3c95e18f2
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f81b06e9d5"
+down_revision: Union[str, None] = "a7d3c95e18f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_username_lower",
+        "user",
+        [sa.text("lower(username)")],
+        unique=True,
+    )
+    op.create_index(
+        "ix_user_email_lower",
+        "user",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+    op.drop_constraint("user_username_key", "user", type_="unique")
+    op.drop_constraint("user_email_key", "user", type_="unique")
+
+
+def downgrade() -> None:
+    op.create_unique_constraint("user_email_key", "user", ["email"])
+    op.create_unique_constraint("user_username_key", "user", ["username"])
+    op.drop_index("ix_user_email_lower", table_name="user")
+    op.drop_index("ix_user_username_lower", table_name="user")
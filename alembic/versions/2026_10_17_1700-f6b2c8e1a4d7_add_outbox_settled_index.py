@@ -0,0 +1,37 @@
+"""Add outbox settled index
+
+Revision ID: f6b2c8e1a4d7
+Revises: e2a9d4c7b315
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6b2c8e1a4d7"
+down_revision: Union[str, None] = "e2a9d4c7b315"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_outbox_settled_updated_at",
+        "outbox",
+        ["updated_at"],
+        unique=False,
+        postgresql_where=sa.text("status <> 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_outbox_settled_updated_at",
+        table_name="outbox",
+        postgresql_where=sa.text("status <> 'PENDING'"),
+    )
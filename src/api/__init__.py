@@ -26,7 +26,9 @@ from src.api.v1.routers import (
 )
 from src.database.db import get_async_session
 from src.metadata import ERRORS_MAP
-from src.schemas.response import BaseResponse
+from src.schemas.response import BaseResponse, PayloadResponse
+from src.utils.auth.validators import get_current_admin_auth_user
+from src.utils.metrics import metrics
 
 router = APIRouter()
 router.include_router(v1_auth_router, prefix='/v1', tags=['Authentication | v1'])
@@ -62,3 +64,14 @@ async def health_check(
     )
 
     return BaseResponse()
+
+
+@router.get(
+    path='/metrics/',
+    tags=['Metrics'],
+    status_code=HTTP_200_OK,
+    dependencies=[Depends(get_current_admin_auth_user)],
+)
+async def get_metrics() -> PayloadResponse:
+    """Get in-process metrics of the current worker, available to admins only."""
+    return PayloadResponse(payload=metrics.snapshot())
@@ -5,11 +5,15 @@ from fastapi import (
     Depends,
     Form,
 )
-from starlette.status import HTTP_200_OK, HTTP_201_CREATED
+from pydantic import UUID4
+from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_202_ACCEPTED
 
 from src.api.v1.services import AuthService
 from src.schemas.auth import (
+    BulkInviteRequest,
     CheckAccountResponse,
+    InviteJobCreateResponse,
+    InviteJobResponse,
     SignUpCompleteRequest,
     SignUpConfirmUserInCompanyRequest,
 )
@@ -56,6 +60,33 @@ async def send_invite_with_role_in_company(
     return BaseResponse()
 
 
+@router.post('/send-invites/{company_id}', status_code=HTTP_202_ACCEPTED)
+async def send_invites_in_company(
+    company_id: UUID4,
+    data: BulkInviteRequest,
+    service: AuthService = Depends(AuthService),
+    current_user: UserSchema = Depends(get_current_active_auth_user),
+) -> InviteJobCreateResponse:
+    """Send invites to many users of company, returning job to follow their delivery."""
+    job = await service.invite_employees(
+        company_id=company_id,
+        invites=data.invites,
+        current_user=current_user,
+    )
+    return InviteJobCreateResponse(status=HTTP_202_ACCEPTED, payload=job)
+
+
+@router.get('/send-invites/jobs/{job_id}', status_code=HTTP_200_OK)
+async def get_invite_job(
+    job_id: UUID4,
+    service: AuthService = Depends(AuthService),
+    current_user: UserSchema = Depends(get_current_active_auth_user),
+) -> InviteJobResponse:
+    """Get delivery status of every recipient of bulk invite job."""
+    job = await service.get_invite_job(job_id=job_id, current_user=current_user)
+    return InviteJobResponse(payload=job)
+
+
 @router.post('/sign-up/confirm/', status_code=HTTP_200_OK)
 async def confirm_invitation(
     invite_token: str,
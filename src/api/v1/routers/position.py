@@ -5,11 +5,23 @@ from pydantic import UUID4
 from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
 
 from src.api.v1.services.position import PositionService
-from src.schemas.position import PositionCreateRequest, PositionInDB, PositionResponse, PositionUpdateRequest
+from src.schemas.position import (
+    PositionBulkCreateRequest,
+    PositionBulkCreateResponse,
+    PositionCreateRequest,
+    PositionInDB,
+    PositionResponse,
+    PositionUpdateRequest,
+)
 from src.schemas.position_in_subdivision import CreatePositionInSubdivisionRequest, PositionInSubdivisionDB
 from src.schemas.subdivision import SubdivisionInDB
 from src.schemas.user import UserSchema
-from src.schemas.user_in_position import CreatePositionAssignmentRequest, PositionAssignmentDB
+from src.schemas.user_in_position import (
+    CreatePositionAssignmentRequest,
+    PositionAssignmentBulkResult,
+    PositionAssignmentSyncRequest,
+    PositionAssignmentSyncResponse,
+)
 from src.utils.auth.validators import get_current_admin_auth_user
 
 if TYPE_CHECKING:
@@ -36,6 +48,22 @@ async def create_position(
     return None
 
 
+@router.post(
+    '/create_positions',
+    status_code=HTTP_201_CREATED,
+)
+async def create_positions(
+    positions_data: PositionBulkCreateRequest,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: PositionService = Depends(PositionService),
+) -> PositionBulkCreateResponse:
+    """Create several positions of subdivision, skipping titles that already exist."""
+    result = await service.create_positions(
+        subdivision_id=positions_data.subdivision_id, titles=positions_data.titles, admin=admin,
+    )
+    return PositionBulkCreateResponse(payload=result)
+
+
 @router.get('/{position_id}', status_code=HTTP_200_OK)
 async def get_position(
     position_id: int,
@@ -89,15 +117,33 @@ async def add_users_to_position(
     users_position_data: CreatePositionAssignmentRequest,
     admin: UserSchema = Depends(get_current_admin_auth_user),
     service: PositionService = Depends(PositionService),
-) -> list[PositionAssignmentDB]:
+) -> PositionAssignmentBulkResult:
     """Add users to position."""
     if admin:
-        user_position: list[PositionAssignmentDB] = await service.add_users_to_position(
+        user_position: PositionAssignmentBulkResult = await service.add_users_to_position(
             users_position_data=users_position_data.model_dump(),
+            admin=admin,
         )
         return user_position
 
 
+@router.put(
+    '/{position_id}/assignments',
+    status_code=HTTP_200_OK,
+)
+async def sync_position_assignments(
+    position_id: int,
+    assignments_data: PositionAssignmentSyncRequest,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: PositionService = Depends(PositionService),
+) -> PositionAssignmentSyncResponse:
+    """Replace holders of position with the given users."""
+    result = await service.sync_position_assignments(
+        position_id=position_id, user_ids=assignments_data.user_ids, admin=admin,
+    )
+    return PositionAssignmentSyncResponse(payload=result)
+
+
 @router.post(
     '/add_position_to_subdivision',
     status_code=HTTP_201_CREATED,
@@ -1,19 +1,39 @@
+import csv
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
-from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+)
 
 from src.api.v1.services.subdivision import SubdivisionService
+from src.config import settings
+from src.schemas.filter import BaseFilter
+from src.schemas.position import PositionPageResponse
 from src.schemas.subdivision import (
+    SubdivisionAncestorsListResponse,
+    SubdivisionAncestorsRequest,
     SubdivisionCreateRequest,
     SubdivisionCreateResponse,
+    SubdivisionImportResponse,
     SubdivisionInDB,
+    SubdivisionMoveRequest,
+    SubdivisionNodeStatsListResponse,
     SubdivisionResponse,
+    SubdivisionShortListResponse,
+    SubdivisionStatsResponse,
+    SubdivisionTreeResponse,
     SubdivisionUpdateByNameRequest,
 )
 from src.schemas.user import UserSchema
 from src.utils.auth.validators import get_current_admin_auth_user
+from src.utils.org_chart_import import parse_org_chart_csv, parse_org_chart_json
 
 if TYPE_CHECKING:
     from src.models import SubdivisionModel
@@ -38,6 +58,67 @@ async def create_subdivision(
         return SubdivisionCreateResponse(payload=new_subdivision)
 
 
+@router.post('/{company_id}/import', status_code=HTTP_201_CREATED)
+async def import_subdivisions(
+    company_id: UUID4,
+    file: UploadFile,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> SubdivisionImportResponse:
+    """Import subdivisions of company from CSV or JSON file with name and parent of every row."""
+    max_size = settings.org_chart_import.max_file_size_bytes
+    content = await file.read(max_size + 1)
+    if len(content) > max_size:
+        raise HTTPException(
+            status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f'Org chart file is larger than {max_size} bytes',
+        )
+    try:
+        if file.content_type == 'application/json' or (file.filename or '').endswith('.json'):
+            rows = parse_org_chart_json(content)
+        else:
+            rows = parse_org_chart_csv(content.decode())
+    except (ValueError, TypeError, AttributeError, csv.Error) as exc:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=f'Invalid org chart file: {exc}')
+    result = await service.import_subdivisions(company_id=company_id, rows=rows, admin=admin)
+    return SubdivisionImportResponse(payload=result)
+
+
+@router.get(
+    '/tree/{company_id}',
+    status_code=HTTP_200_OK,
+    response_model=SubdivisionTreeResponse,
+)
+async def get_subdivision_tree(
+    company_id: UUID4,
+    root: int | None = None,
+    max_depth: int | None = Query(default=None, ge=0),
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> StreamingResponse:
+    """Get nested subdivision tree of company, optionally starting from the root subdivision."""
+    root_path = await service.get_subdivision_tree_root(
+        company_id=company_id, admin=admin, root=root,
+    )
+    return StreamingResponse(
+        service.stream_subdivision_tree(
+            company_id=company_id, root_path=root_path, max_depth=max_depth,
+        ),
+        media_type='application/json',
+    )
+
+
+@router.get('/tree/{company_id}/stats', status_code=HTTP_200_OK)
+async def get_company_subdivisions_stats(
+    company_id: UUID4,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> SubdivisionNodeStatsListResponse:
+    """Get rolled-up headcount and position counts of every subdivision of company."""
+    stats = await service.get_company_subdivisions_stats(company_id=company_id, admin=admin)
+    return SubdivisionNodeStatsListResponse(payload=stats)
+
+
 @router.get('/{subdivision_id}', status_code=HTTP_200_OK)
 async def get_subdivision(
     subdivision_id: int,
@@ -52,6 +133,70 @@ async def get_subdivision(
         return SubdivisionResponse(payload=subdivision.to_pydantic_schema())
 
 
+@router.get('/{subdivision_id}/children', status_code=HTTP_200_OK)
+async def get_subdivision_children(
+    subdivision_id: int,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> SubdivisionShortListResponse:
+    """Get direct children of subdivision."""
+    children = await service.get_subdivision_children(
+        subdivision_id=subdivision_id, admin=admin,
+    )
+    return SubdivisionShortListResponse(payload=children)
+
+
+@router.get('/{subdivision_id}/stats', status_code=HTTP_200_OK)
+async def get_subdivision_stats(
+    subdivision_id: int,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> SubdivisionStatsResponse:
+    """Get headcount and position counts of subdivision including all its sub-subdivisions."""
+    stats = await service.get_subdivision_stats(subdivision_id=subdivision_id, admin=admin)
+    return SubdivisionStatsResponse(payload=stats)
+
+
+@router.get('/{subdivision_id}/positions', status_code=HTTP_200_OK)
+async def get_subdivision_positions(
+    subdivision_id: int,
+    filters: BaseFilter = Depends(BaseFilter),
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> PositionPageResponse:
+    """Get positions of subdivision ordered by title, page by page."""
+    page = await service.get_subdivision_positions(
+        subdivision_id=subdivision_id, admin=admin, filters=filters,
+    )
+    return PositionPageResponse(payload=page)
+
+
+@router.get('/{subdivision_id}/ancestors', status_code=HTTP_200_OK)
+async def get_subdivision_ancestors(
+    subdivision_id: int,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> SubdivisionShortListResponse:
+    """Get chain of parent subdivisions, top-level one first."""
+    ancestors = await service.get_subdivision_ancestors(
+        subdivision_id=subdivision_id, admin=admin,
+    )
+    return SubdivisionShortListResponse(payload=ancestors)
+
+
+@router.post('/ancestors/batch', status_code=HTTP_200_OK)
+async def get_subdivisions_ancestors(
+    ancestors_data: SubdivisionAncestorsRequest,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> SubdivisionAncestorsListResponse:
+    """Get chains of parent subdivisions for many subdivisions at once."""
+    chains = await service.get_subdivisions_ancestors(
+        subdivision_ids=ancestors_data.ids, admin=admin,
+    )
+    return SubdivisionAncestorsListResponse(payload=chains)
+
+
 @router.put('/{subdivision_id}', status_code=HTTP_200_OK)
 async def update_subdivision(
     subdivision_id: int,
@@ -64,15 +209,34 @@ async def update_subdivision(
         updated_subdivision: SubdivisionInDB = await service.update_subdivision_by_id(
             subdivision_id=subdivision_id,
             subdivision_data=subdivision_data.model_dump(),
+            admin=admin,
         )
         return SubdivisionResponse(payload=updated_subdivision)
 
 
+@router.put('/{subdivision_id}/move', status_code=HTTP_200_OK)
+async def move_subdivision(
+    subdivision_id: int,
+    move_data: SubdivisionMoveRequest,
+    admin: UserSchema = Depends(get_current_admin_auth_user),
+    service: SubdivisionService = Depends(SubdivisionService),
+) -> SubdivisionResponse:
+    """Move subdivision with its descendants under another parent."""
+    moved_subdivision: SubdivisionInDB = await service.move_subdivision(
+        subdivision_id=subdivision_id,
+        parent_id=move_data.parent_id,
+        admin=admin,
+    )
+    return SubdivisionResponse(payload=moved_subdivision)
+
+
 @router.delete(
     '/{subdivision_id}', status_code=HTTP_204_NO_CONTENT,
 )
 async def delete_subdivision(
     subdivision_id: int,
+    *,
+    cascade: bool = False,
     admin: UserSchema = Depends(get_current_admin_auth_user),
     service: SubdivisionService = Depends(SubdivisionService),
 ) -> None:
@@ -80,4 +244,6 @@ async def delete_subdivision(
     if admin:
         await service.delete_subdivision_by_id(
             subdivision_id=subdivision_id,
+            admin=admin,
+            cascade=cascade,
         )
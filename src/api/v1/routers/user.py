@@ -14,7 +14,7 @@ from src.schemas.user import (
     UserFilters,
     UserResponse,
     UserSchema,
-    UsersListResponse,
+    UsersPageResponse,
 )
 from src.utils.auth.validators import get_current_active_auth_user, get_current_admin_auth_user
 
@@ -91,7 +91,10 @@ async def delete_user(
 async def get_users_by_filters(
     filters: UserFilters = Depends(UserFilters),
     service: UserService = Depends(UserService),
-) -> UsersListResponse:
-    """Get users by filters."""
-    users = await service.get_users_by_filters(filters)
-    return UsersListResponse(payload=users)
+    current_user: UserSchema = Depends(get_current_active_auth_user),
+) -> UsersPageResponse:
+    """Get users of company by filters, page by page."""
+    page = await service.get_users_by_filters(filters, current_user=current_user)
+    return UsersPageResponse(
+        payload=page.items, next_cursor=page.next_cursor, total_estimate=page.total_estimate,
+    )
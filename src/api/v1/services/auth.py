@@ -1,23 +1,42 @@
+import asyncio
+import uuid
+from collections.abc import Sequence
+from functools import partial
+
 from fastapi import HTTPException
 from pydantic import UUID4
-from starlette.status import HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
 
 from src.models import UserModel
 from src.schemas.auth import (
+    BulkInviteItem,
+    InviteJobStatus,
+    InviteRecipientStatus,
+    InviteStatus,
     SignUpCompleteRequest,
 )
+from src.schemas.outbox import OutboxStatus
 from src.schemas.user import UserRole, UserSchema
 from src.utils.auth.invite_token import (
     generate_admin_invite_token,
     generate_employee_invite_token,
-    send_invitation_email,
+    generate_employee_invite_tokens,
+    invitation_outbox_message,
     verify_invite_token,
 )
-from src.utils.auth.jwt_tools import hash_password
+from src.utils.auth.password_hasher import hash_password_async
+from src.utils.auth.user_cache import auth_user_cache
 from src.utils.auth.validators import check_company_is_yours, check_user_is_admin
 from src.utils.service import BaseService
 from src.utils.unit_of_work import transaction_mode
 
+INVITE_TOKEN_BATCH_SIZE = 250
+INVITE_STATUSES = {
+    OutboxStatus.PENDING: InviteStatus.QUEUED,
+    OutboxStatus.SENT: InviteStatus.SENT,
+    OutboxStatus.FAILED: InviteStatus.FAILED,
+}
+
 
 class AuthService(BaseService):
     @transaction_mode
@@ -36,7 +55,7 @@ class AuthService(BaseService):
                 detail='Account already exists',
             )
         invite_token = generate_admin_invite_token(account, role=UserRole.ADMIN)
-        await send_invitation_email(account, invite_token)
+        await self.uow.outbox.add_many([invitation_outbox_message(account, invite_token)])
 
     @transaction_mode
     async def initiate_employee_registration(
@@ -50,7 +69,85 @@ class AuthService(BaseService):
         check_company_is_yours(current_user, company_id)
         account = account.lower()
         invite_token = generate_employee_invite_token(company_id, account, role)
-        await send_invitation_email(account, invite_token)
+        await self.uow.outbox.add_many([
+            invitation_outbox_message(account, invite_token, company_id=company_id),
+        ])
+
+    async def invite_employees(
+        self,
+        company_id: UUID4,
+        invites: Sequence[BulkInviteItem],
+        current_user: UserSchema,
+    ) -> InviteJobStatus:
+        """Invite inactive users of company in bulk, delivery is tracked by the returned job."""
+        check_user_is_admin(current_user)
+        check_company_is_yours(current_user, company_id)
+        roles = {}
+        for invite in invites:
+            roles.setdefault(invite.email, invite.role)
+        users = await self._get_users_by_emails(list(roles))
+        users_by_email = {user.email.lower(): user for user in users}
+
+        job_id = uuid.uuid4()
+        recipients: list[InviteRecipientStatus] = []
+        accepted: list[tuple[str, UserRole]] = []
+        for email, role in roles.items():
+            user = users_by_email.get(email)
+            if user is None or user.company_id != company_id:
+                status = InviteStatus.NOT_IN_COMPANY
+            elif user.active:
+                status = InviteStatus.ALREADY_ACTIVE
+            else:
+                status = InviteStatus.QUEUED
+                accepted.append((email, role))
+            recipients.append(InviteRecipientStatus(email=email, status=status))
+
+        tokens = await self._sign_employee_invite_tokens(company_id, accepted)
+        await self._add_outbox_messages([
+            invitation_outbox_message(email, invite_token, job_id=job_id, company_id=company_id)
+            for (email, _), invite_token in zip(accepted, tokens, strict=True)
+        ])
+        return InviteJobStatus(job_id=job_id, company_id=company_id, recipients=recipients)
+
+    @transaction_mode
+    async def get_invite_job(self, job_id: UUID4, current_user: UserSchema) -> InviteJobStatus:
+        """Get delivery status of every invited recipient of bulk invite job."""
+        check_user_is_admin(current_user)
+        messages = await self.uow.outbox.get_job_messages(job_id, company_id=current_user.company_id)
+        if not messages:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND,
+                detail='Invite job not found',
+            )
+        return InviteJobStatus(
+            job_id=job_id,
+            company_id=current_user.company_id,
+            recipients=[
+                InviteRecipientStatus(email=message.recipient, status=INVITE_STATUSES[message.status])
+                for message in messages
+            ],
+        )
+
+    @transaction_mode
+    async def _get_users_by_emails(self, emails: Sequence[str]) -> Sequence[UserModel]:
+        return await self.uow.user.get_by_emails(emails)
+
+    @transaction_mode
+    async def _add_outbox_messages(self, messages: Sequence[dict]) -> None:
+        await self.uow.outbox.add_many(messages)
+
+    @staticmethod
+    async def _sign_employee_invite_tokens(
+        company_id: UUID4, invites: Sequence[tuple[str, UserRole]],
+    ) -> list[str]:
+        """Sign invite tokens in batches on worker threads, keeping the event loop free."""
+        loop = asyncio.get_running_loop()
+        size = INVITE_TOKEN_BATCH_SIZE
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(None, generate_employee_invite_tokens, company_id, invites[i:i + size])
+            for i in range(0, len(invites), size)
+        ))
+        return [invite_token for batch in batches for invite_token in batch]
 
     @transaction_mode
     async def confirm_invitation(self, invite_token: str) -> dict:
@@ -62,7 +159,6 @@ class AuthService(BaseService):
             )
         return payload
 
-    @transaction_mode
     async def complete_company_with_admin_registration(
             self,
             payload: dict,
@@ -74,7 +170,15 @@ class AuthService(BaseService):
                 status_code=HTTP_400_BAD_REQUEST,
                 detail='Account emails do not match',
             )
+        hashed_pwd = await hash_password_async(data.password)
+        return await self._create_company_with_admin(data, hashed_pwd)
 
+    @transaction_mode
+    async def _create_company_with_admin(
+            self,
+            data: SignUpCompleteRequest,
+            hashed_pwd: bytes,
+    ) -> UserModel:
         if not await self.check_account_availability(data.email):
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST,
@@ -86,7 +190,6 @@ class AuthService(BaseService):
             inn=None,
         )
 
-        hashed_pwd = hash_password(data.password)
         user = await self.uow.user.add_one_and_get_obj(
             email=data.email,
             hashed_password=hashed_pwd,
@@ -130,4 +233,5 @@ class AuthService(BaseService):
             role=role,
             active=True,
         )
+        self.uow.add_after_commit(partial(auth_user_cache.invalidate, user.id))
         return user
@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+from functools import partial
+
 from fastapi import HTTPException
 from pydantic import UUID4
 from starlette import status
@@ -9,12 +12,14 @@ from src.models import (
     SubdivisionModel,
     UserModel,
 )
-from src.schemas.position import PositionInDB
+from src.schemas.position import PositionBulkCreateResult, PositionInDB
 from src.schemas.position_in_subdivision import PositionInSubdivisionDB
 from src.schemas.subdivision import SubdivisionInDB
-from src.schemas.user_in_position import PositionAssignmentDB
+from src.schemas.user import UserSchema
+from src.schemas.user_in_position import PositionAssignmentBulkResult, PositionAssignmentSyncResult
+from src.utils.org_tree_cache import org_tree_cache
 from src.utils.service import BaseService
-from src.utils.unit_of_work import transaction_mode
+from src.utils.unit_of_work import retry_on_conflict, transaction_mode
 
 
 class PositionService(BaseService):
@@ -23,15 +28,36 @@ class PositionService(BaseService):
     @transaction_mode
     async def create_position(self, position_data: dict) -> PositionInDB:
         """Create position of subdivision."""
-        position: PositionModel = await self.uow.position.get_by_query_one_or_none(
-            subdivision_id=position_data['subdivision_id'],
-        )
-        self._check_position_already_exists(position=position)
-        created_position: PositionModel = await self.uow.position.add_one_and_get_obj(
+        created_position: PositionModel | None = await self.uow.position.add_one_ignore_existing(
             **position_data,
         )
+        self._check_position_created(position=created_position)
+        await self.uow.subdivision_stats.increment(created_position.subdivision_id, positions_delta=1)
         return created_position.to_pydantic_schema()
 
+    @transaction_mode
+    async def create_positions(
+            self, subdivision_id: int, titles: Sequence[str], admin: UserSchema,
+    ) -> PositionBulkCreateResult:
+        """Create positions of subdivision in one statement, reporting titles that already exist."""
+        subdivision: SubdivisionModel | None = await self.uow.subdivision.get_by_query_one_or_none(
+            id=subdivision_id, company_id=admin.company_id,
+        )
+        self._check_subdivision_exists(subdivision=subdivision)
+        titles = list(dict.fromkeys(titles))
+        created_positions: Sequence[PositionModel] = await self.uow.position.upsert_many(
+            [{'subdivision_id': subdivision.id, 'title': title} for title in titles],
+            constraint='unique_position_in_subdivision_name',
+            update_columns=(),
+            returning=True,
+        )
+        created_titles = {position.title for position in created_positions}
+        await self.uow.subdivision_stats.increment(subdivision.id, positions_delta=len(created_positions))
+        return PositionBulkCreateResult(
+            created=[position.to_pydantic_schema() for position in created_positions],
+            duplicates=[title for title in titles if title not in created_titles],
+        )
+
     @transaction_mode
     async def get_position_by_id(
             self,
@@ -65,28 +91,61 @@ class PositionService(BaseService):
             id=position_id,
         )
         self._check_position_exists(position=position)
+        await self.uow.subdivision_stats.decrement_for_position(position.id)
         await self.uow.position.delete_by_query(id=position_id)
 
     @transaction_mode
     async def add_users_to_position(
-            self, users_position_data: dict,
-    ) -> list[PositionAssignmentDB]:
-        """Add users to position."""
-        position: PositionModel = await self.uow.position.get_by_query_one_or_none(
-            id=users_position_data['position_id'],
+            self, users_position_data: dict, admin: UserSchema,
+    ) -> PositionAssignmentBulkResult:
+        """Add users to position, reporting missing and already assigned users."""
+        position: PositionModel | None = await self.uow.position.get_position_in_company(
+            position_id=users_position_data['position_id'], company_id=admin.company_id,
         )
         self._check_position_exists(position=position)
-        users_position_list = []
-        for user_id in users_position_data['user_id']:
-            user: UserModel = await self.uow.user.get_by_query_one_or_none(id=user_id)
-            self._check_user_exists(user=user)
-            user_position: PositionAssignmentModel = (
-                await self.uow.position_assignment.add_one_and_get_obj(
-                    user_id=user_id, position_id=position.id,
-                )
-            )
-            users_position_list.append(user_position.to_pydantic_schema())
-        return users_position_list
+        user_ids = list(dict.fromkeys(users_position_data['user_id']))
+        existing_ids = await self.uow.user.get_existing_ids(user_ids, company_id=admin.company_id)
+        found_ids = [user_id for user_id in user_ids if user_id in existing_ids]
+        assignments: Sequence[PositionAssignmentModel] = (
+            await self.uow.position_assignment.add_users_ignore_assigned(position.id, found_ids)
+            if found_ids else []
+        )
+        assigned_ids = {assignment.user_id for assignment in assignments}
+        await self.uow.subdivision_stats.increment(
+            position.subdivision_id, headcount_delta=len(assignments),
+        )
+        return PositionAssignmentBulkResult(
+            assigned=[assignment.to_pydantic_schema() for assignment in assignments],
+            already_assigned=[user_id for user_id in found_ids if user_id not in assigned_ids],
+            not_found=[user_id for user_id in user_ids if user_id not in existing_ids],
+        )
+
+    @retry_on_conflict
+    @transaction_mode
+    async def sync_position_assignments(
+            self, position_id: int, user_ids: Sequence[UUID4], admin: UserSchema,
+    ) -> PositionAssignmentSyncResult:
+        """Make the given users the only holders of position, applying the difference in two statements."""
+        position: PositionModel | None = await self.uow.position.get_position_in_company(
+            position_id=position_id, company_id=admin.company_id,
+        )
+        self._check_position_exists(position=position)
+        user_ids = list(dict.fromkeys(user_ids))
+        removed = await self.uow.position_assignment.remove_users_except(position.id, user_ids)
+        desired = await self.uow.position_assignment.add_company_users(
+            position.id, user_ids, company_id=admin.company_id,
+        )
+        added = [row.user_id for row in desired if row.added]
+        found_ids = {row.user_id for row in desired}
+        await self.uow.subdivision_stats.increment(
+            position.subdivision_id, headcount_delta=len(added) - len(removed),
+        )
+        return PositionAssignmentSyncResult(
+            added=added,
+            removed=removed,
+            unchanged=[row.user_id for row in desired if not row.added],
+            not_found=[user_id for user_id in user_ids if user_id not in found_ids],
+        )
 
     @transaction_mode
     async def add_position_to_subdivision(
@@ -119,6 +178,7 @@ class PositionService(BaseService):
             id=subdivision_id,
         )
         self._check_subdivision_exists(subdivision=subdivision)
+        self.uow.add_after_commit(partial(org_tree_cache.invalidate, subdivision.company_id))
         subdivision_manager: SubdivisionModel = (
             await self.uow.subdivision.update_one_by_id(
                 obj_id=subdivision.id, id=subdivision_id, manager_id=user.id,
@@ -127,8 +187,8 @@ class PositionService(BaseService):
         return subdivision_manager.to_pydantic_schema()
 
     @staticmethod
-    def _check_position_already_exists(position: PositionModel | None) -> None:
-        if position:
+    def _check_position_created(position: PositionModel | None) -> None:
+        if not position:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail='Position already exists!',
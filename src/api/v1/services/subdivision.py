@@ -1,27 +1,46 @@
-from typing import TYPE_CHECKING, Any
+import time
+from collections.abc import AsyncIterator, Sequence
+from functools import partial
+from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
+from loguru import logger
 from pydantic import UUID4
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy_utils import Ltree
 from starlette import status
 
-from src.models import CompanyModel, SubdivisionModel
-from src.schemas.subdivision import SubdivisionInDB
+from src.config import settings
+from src.models import CompanyModel, PositionModel, SubdivisionModel
+from src.schemas.filter import BaseFilter
+from src.schemas.position import PositionPage
+from src.schemas.subdivision import (
+    SubdivisionAncestors,
+    SubdivisionImportResult,
+    SubdivisionImportRowError,
+    SubdivisionInDB,
+    SubdivisionNodeStats,
+    SubdivisionShort,
+    SubdivisionStats,
+)
 from src.schemas.user import UserSchema
 from src.utils.auth.validators import check_company_is_yours
+from src.utils.metrics import metrics
+from src.utils.org_chart_import import OrgChartRow, plan_org_chart_import
+from src.utils.org_tree_cache import OrgTree, OrgTreeNode, org_tree_cache
 from src.utils.service import BaseService
-from src.utils.unit_of_work import transaction_mode
+from src.utils.subdivision_tree import iter_subdivision_tree_json
+from src.utils.unit_of_work import retry_on_conflict, transaction_mode
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-
-    from sqlalchemy import Row
+    from src.utils.pagination import Page
 
 
 class SubdivisionService(BaseService):
     base_repository = 'subdivision'
 
+    @retry_on_conflict
     @transaction_mode
     async def create_subdivision(
             self, company_id: UUID4, subdivision_data: dict, admin: UserSchema,
@@ -36,6 +55,8 @@ class SubdivisionService(BaseService):
         )
         self._check_company_exists(company=company)
         check_company_is_yours(user=admin, company_id=company.id)
+        await self._lock_company_tree(company.id)
+        self._invalidate_org_tree(company.id)
         if subdivision_name == company.company_name:
             self._incorrect_parent_or_name_exists_error()
         elif subdivision_name == subdivision_parent:
@@ -51,7 +72,9 @@ class SubdivisionService(BaseService):
             except IntegrityError:
                 self._subdivision_exists_error()
         parent_subdivision: Ltree | None = (
-            await self.uow.subdivision.get_all_path_of_parent(subdivision_parent)
+            await self.uow.subdivision.get_all_path_of_parent(
+                company_id=company.id, parent=subdivision_parent,
+            )
         )
         self._check_parent_subdivision_exists(parent_subdivision=parent_subdivision)
         try:
@@ -64,6 +87,36 @@ class SubdivisionService(BaseService):
         except IntegrityError:
             self._subdivision_exists_error()
 
+    @retry_on_conflict
+    @transaction_mode
+    async def import_subdivisions(
+            self, company_id: UUID4, rows: Sequence[OrgChartRow], admin: UserSchema | None = None,
+    ) -> SubdivisionImportResult:
+        """Import subdivisions of company from ``(name, parent)`` rows in a single bulk load."""
+        company: CompanyModel = await self.uow.company.get_by_query_one_or_none(
+            id=company_id,
+        )
+        self._check_company_exists(company=company)
+        if admin is not None:
+            check_company_is_yours(user=admin, company_id=company.id)
+        await self._lock_company_tree(company.id)
+        existing_rows = await self.uow.subdivision.get_company_tree_rows(company.id)
+        existing_paths = {row.name: str(row.path) for row in existing_rows}
+        plan = plan_org_chart_import(rows, existing_paths, reserved_names=(company.company_name,))
+        created = set()
+        if plan.records:
+            self._invalidate_org_tree(company.id)
+            created = await self.uow.subdivision.copy_subdivisions(company.id, plan.records)
+        errors = [SubdivisionImportRowError(row=e.row, name=e.name, detail=e.detail) for e in plan.errors]
+        errors.extend(
+            SubdivisionImportRowError(
+                row=plan.rows_by_name[name], name=name, detail='Subdivision already exists',
+            )
+            for name, _path in plan.records
+            if name not in created
+        )
+        return SubdivisionImportResult(created=len(created), errors=errors)
+
     @transaction_mode
     async def get_subdivision_by_id(
             self,
@@ -76,50 +129,263 @@ class SubdivisionService(BaseService):
         self._check_subdivision_exists(subdivision)
         return subdivision
 
+    @transaction_mode
+    async def get_subdivision_tree_root(
+            self, company_id: UUID4, admin: UserSchema, root: int | None = None,
+    ) -> Ltree | None:
+        """Check access to the company tree and get path of its requested root subdivision."""
+        company: CompanyModel = await self.uow.company.get_by_query_one_or_none(
+            id=company_id,
+        )
+        self._check_company_exists(company=company)
+        check_company_is_yours(user=admin, company_id=company.id)
+        if root is None:
+            return None
+        subdivision: SubdivisionModel | None = await self.uow.subdivision.get_by_query_one_or_none(
+            id=root, company_id=company.id,
+        )
+        self._check_subdivision_exists(subdivision)
+        return subdivision.path
+
+    async def stream_subdivision_tree(
+            self, company_id: UUID4, root_path: Ltree | None = None, max_depth: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream nested subdivision tree of company as JSON, loaded with a single query."""
+        max_level = None
+        if max_depth is not None:
+            max_level = (len(root_path) if root_path else 1) + max_depth
+        async with self.uow:
+            rows = self.uow.subdivision.stream_subtree(
+                company_id=company_id, root_path=root_path, max_level=max_level,
+            )
+            async for chunk in iter_subdivision_tree_json(rows):
+                yield chunk
+
+    @transaction_mode
+    async def get_subdivision_children(
+            self, subdivision_id: int, admin: UserSchema,
+    ) -> list[SubdivisionShort]:
+        """Get direct children of subdivision from the cached company tree."""
+        tree = await self._get_org_tree(admin.company_id)
+        self._check_subdivision_exists(tree.by_id.get(subdivision_id))
+        return [self._node_to_schema(node) for node in tree.get_children(subdivision_id)]
+
+    @transaction_mode
+    async def get_subdivision_ancestors(
+            self, subdivision_id: int, admin: UserSchema,
+    ) -> list[SubdivisionShort]:
+        """Get ancestors of subdivision from the cached company tree, top-level one first."""
+        tree = await self._get_org_tree(admin.company_id)
+        self._check_subdivision_exists(tree.by_id.get(subdivision_id))
+        return [self._node_to_schema(node) for node in tree.get_ancestors(subdivision_id)]
+
+    @transaction_mode
+    async def get_subdivisions_ancestors(
+            self, subdivision_ids: Sequence[int], admin: UserSchema,
+    ) -> list[SubdivisionAncestors]:
+        """Get ancestor chains of many subdivisions of admin's company with a single query."""
+        chains: dict[int, SubdivisionAncestors] = {}
+        for row in await self.uow.subdivision.get_ancestor_chains(admin.company_id, subdivision_ids):
+            chain = chains.setdefault(
+                row.subdivision_id, SubdivisionAncestors(subdivision_id=row.subdivision_id),
+            )
+            if row.id is not None:
+                chain.ancestors.append(
+                    SubdivisionShort(id=row.id, name=row.name, path=row.path, manager_id=row.manager_id),
+                )
+        return list(chains.values())
+
+    @transaction_mode
+    async def get_subdivision_stats(self, subdivision_id: int, admin: UserSchema) -> SubdivisionStats:
+        """Get number of subdivisions, positions and filled assignments in the subdivision subtree."""
+        subdivision: SubdivisionModel | None = await self.uow.subdivision.get_by_query_one_or_none(
+            id=subdivision_id, company_id=admin.company_id,
+        )
+        self._check_subdivision_exists(subdivision)
+        if settings.subdivision_stats.use_counters:
+            totals = await self.uow.subdivision_stats.get_subtree_totals(
+                company_id=subdivision.company_id, path=subdivision.path,
+            )
+        else:
+            totals = await self.uow.subdivision.get_subtree_stats(
+                company_id=subdivision.company_id, path=subdivision.path,
+            )
+        return SubdivisionStats.model_validate(totals, from_attributes=True)
+
+    @transaction_mode
+    async def get_subdivision_positions(
+            self, subdivision_id: int, admin: UserSchema, filters: BaseFilter,
+    ) -> PositionPage:
+        """Get page of subdivision positions ordered by title."""
+        subdivision: SubdivisionModel | None = await self.uow.subdivision.get_by_query_one_or_none(
+            id=subdivision_id, company_id=admin.company_id,
+        )
+        self._check_subdivision_exists(subdivision)
+        page: Page[PositionModel] = await self.uow.position.get_subdivision_positions_page(
+            subdivision_id=subdivision.id, filters=filters,
+        )
+        return PositionPage(
+            items=[position.to_pydantic_schema() for position in page.items],
+            next_cursor=page.next_cursor,
+            total_estimate=page.total_estimate,
+        )
+
+    @transaction_mode
+    async def get_company_subdivisions_stats(
+            self, company_id: UUID4, admin: UserSchema,
+    ) -> list[SubdivisionNodeStats]:
+        """Get rolled-up stats of every subdivision of company."""
+        check_company_is_yours(user=admin, company_id=company_id)
+        if settings.subdivision_stats.use_counters:
+            rows = await self.uow.subdivision_stats.get_company_counts(company_id)
+        else:
+            rows = await self.uow.subdivision.get_company_stats(company_id)
+        return self._roll_up_stats(rows)
+
+    @retry_on_conflict
     @transaction_mode
     async def update_subdivision_by_id(
             self,
             subdivision_id: int,
             subdivision_data: dict,
+            admin: UserSchema,
     ) -> SubdivisionInDB:
         """Update subdivision of company by name."""
+        await self._lock_company_tree(admin.company_id)
         subdivision: SubdivisionModel = await self.uow.subdivision.get_by_query_one_or_none(
-            id=subdivision_id,
+            id=subdivision_id, company_id=admin.company_id,
         )
         self._check_subdivision_exists(subdivision)
-        children: Sequence[Row[tuple[Any, ...] | Any]] = (
-            await self.uow.subdivision.get_children_paths(
-                subdivision_name=subdivision.name,
-            )
-        )
-        path = str(subdivision.path)
+        self._invalidate_org_tree(subdivision.company_id)
         subdivision_data_name = subdivision_data['name']
-        new_path = path.replace(f'{subdivision.name}', f'{subdivision_data_name}')
+        labels = subdivision.path.path.split('.')
+        labels[-1] = subdivision_data_name
+        old_path, new_path = subdivision.path, Ltree('.'.join(labels))
         try:
             updated_subdivision: SubdivisionModel = (
                 await self.uow.subdivision.update_one_by_id(
-                    obj_id=subdivision.id, name=subdivision_data_name, path=Ltree(new_path),
+                    obj_id=subdivision.id, name=subdivision_data_name, path=new_path,
                 )
             )
-            await self.uow.subdivision.update_children_paths(children, subdivision_data_name)
-            return updated_subdivision.to_pydantic_schema()
         except IntegrityError:
             self._subdivision_name_exists_error()
+        await self.uow.subdivision.rewrite_subtree_path(
+            company_id=subdivision.company_id, old_path=old_path, new_path=new_path,
+        )
+        return updated_subdivision.to_pydantic_schema()
 
+    @retry_on_conflict
     @transaction_mode
-    async def delete_subdivision_by_id(self, subdivision_id: int) -> None:
-        """Delete subdivision of company by name."""
-        subdivision: SubdivisionModel = await self.uow.subdivision.get_by_query_one_or_none(
-            id=subdivision_id,
+    async def move_subdivision(
+            self,
+            subdivision_id: int,
+            parent_id: int | None,
+            admin: UserSchema,
+    ) -> SubdivisionInDB:
+        """Move subdivision with all its descendants under another parent, or to the top level."""
+        await self._lock_company_tree(admin.company_id)
+        subdivision: SubdivisionModel | None = await self.uow.subdivision.get_by_query_one_or_none(
+            id=subdivision_id, company_id=admin.company_id,
         )
-        children: Sequence[Row[tuple[Any, ...] | Any]] = (
-            await self.uow.subdivision.get_children_paths(
-                subdivision_name=subdivision.name,
+        self._check_subdivision_exists(subdivision)
+        new_path = Ltree(subdivision.name)
+        if parent_id is not None:
+            parent: SubdivisionModel | None = await self.uow.subdivision.get_by_query_one_or_none(
+                id=parent_id, company_id=admin.company_id,
             )
+            self._check_parent_subdivision_exists(parent_subdivision=parent)
+            if parent.path.descendant_of(subdivision.path):
+                self._subdivision_cycle_error()
+            new_path = parent.path + new_path
+        self._invalidate_org_tree(subdivision.company_id)
+        old_path = subdivision.path
+        moved_subdivision: SubdivisionModel = await self.uow.subdivision.update_one_by_id(
+            obj_id=subdivision.id, path=new_path,
+        )
+        await self.uow.subdivision.rewrite_subtree_path(
+            company_id=subdivision.company_id, old_path=old_path, new_path=new_path,
+        )
+        return moved_subdivision.to_pydantic_schema()
+
+    @retry_on_conflict
+    @transaction_mode
+    async def delete_subdivision_by_id(
+            self, subdivision_id: int, admin: UserSchema, *, cascade: bool = False,
+    ) -> None:
+        """Delete subdivision of company by id.
+
+        Descendants are re-parented to the deleted node's parent, or removed with it when ``cascade`` is set.
+        """
+        await self._lock_company_tree(admin.company_id)
+        subdivision: SubdivisionModel = await self.uow.subdivision.get_by_query_one_or_none(
+            id=subdivision_id, company_id=admin.company_id,
         )
         self._check_subdivision_exists(subdivision=subdivision)
-        await self.uow.subdivision.change_children_paths(children)
-        await self.uow.subdivision.delete_by_query(name=subdivision.name)
+        self._invalidate_org_tree(subdivision.company_id)
+        if cascade:
+            await self.uow.subdivision.delete_subtree(
+                company_id=subdivision.company_id, path=subdivision.path,
+            )
+            return
+        await self.uow.subdivision.lift_subtree_children(
+            company_id=subdivision.company_id, path=subdivision.path,
+        )
+        await self.uow.subdivision.delete_by_query(id=subdivision.id)
+
+    async def _lock_company_tree(self, company_id: UUID4) -> None:
+        """Take the company hierarchy lock for the rest of the transaction, recording the wait time.
+
+        The metric is not labeled by company to keep its cardinality bounded,
+        waits over the configured threshold are logged with the company instead.
+        """
+        started_at = time.perf_counter()
+        await self.uow.subdivision.lock_company_tree(company_id)
+        wait_seconds = time.perf_counter() - started_at
+        metrics.observe('subdivision_tree_lock_wait_seconds', wait_seconds)
+        if wait_seconds >= settings.subdivision_tree_lock.slow_wait_seconds:
+            logger.bind(company_id=str(company_id), wait_seconds=wait_seconds).warning(
+                f'Waited {wait_seconds:.3f}s for the subdivision tree lock of company {company_id}',
+            )
+
+    async def _get_org_tree(self, company_id: UUID4) -> OrgTree:
+        """Get company tree from the cache, loading it with a single query on a miss."""
+        tree = org_tree_cache.get(company_id)
+        if tree is None:
+            generation = org_tree_cache.generation(company_id)
+            tree = OrgTree(await self.uow.subdivision.get_company_tree_rows(company_id))
+            org_tree_cache.put(company_id, tree, generation)
+        return tree
+
+    def _invalidate_org_tree(self, company_id: UUID4) -> None:
+        """Drop cached company tree once the current transaction is committed."""
+        self.uow.add_after_commit(partial(org_tree_cache.invalidate, company_id))
+
+    @staticmethod
+    def _roll_up_stats(rows: Sequence[Row]) -> list[SubdivisionNodeStats]:
+        """Add counts of every subdivision to its ancestors in one pass over path-ordered rows."""
+        nodes = [
+            SubdivisionNodeStats(
+                id=row.id,
+                name=row.name,
+                path=row.path,
+                subdivisions_count=1,
+                positions_count=row.positions_count,
+                headcount=row.headcount,
+            )
+            for row in rows
+        ]
+        nodes_by_path = {node.path.path: node for node in nodes}
+        for node in reversed(nodes):
+            parent_path, _, _ = node.path.path.rpartition('.')
+            if parent := nodes_by_path.get(parent_path):
+                parent.subdivisions_count += node.subdivisions_count
+                parent.positions_count += node.positions_count
+                parent.headcount += node.headcount
+        return nodes
+
+    @staticmethod
+    def _node_to_schema(node: OrgTreeNode) -> SubdivisionShort:
+        return SubdivisionShort(id=node.id, name=node.name, path=node.path, manager_id=node.manager_id)
 
     @staticmethod
     def _check_subdivision_exists(subdivision: SubdivisionModel | None) -> None:
@@ -136,7 +402,7 @@ class SubdivisionService(BaseService):
             )
 
     @staticmethod
-    def _check_parent_subdivision_exists(parent_subdivision: Ltree | None) -> None:
+    def _check_parent_subdivision_exists(parent_subdivision: Ltree | SubdivisionModel | None) -> None:
         """Check if parent subdivision exists."""
         if not parent_subdivision:
             raise HTTPException(
@@ -152,6 +418,14 @@ class SubdivisionService(BaseService):
             detail='Incorrect parent or name already exists!',
         )
 
+    @staticmethod
+    def _subdivision_cycle_error() -> None:
+        """Raises subdivision cycle error."""
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail='Subdivision cannot be moved under itself or its descendant!',
+        )
+
     @staticmethod
     def _subdivision_exists_error() -> None:
         """Raises subdivision exists error."""
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from functools import partial
 
 from fastapi import HTTPException
 from pydantic import UUID4
@@ -6,28 +6,30 @@ from starlette.status import HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
 
 from src.models import UserModel
 from src.schemas.user import CreateUserRequest, UpdateUserRequest, UserDB, UserFilters, UserSchema
+from src.utils.auth.password_hasher import hash_password_async
+from src.utils.auth.user_cache import auth_user_cache
+from src.utils.pagination import Page
 from src.utils.service import BaseService
 from src.utils.unit_of_work import transaction_mode
-from utils.auth.jwt_tools import hash_password
-
-if TYPE_CHECKING:
-    from collections.abc import Sequence
 
 
 class UserService(BaseService):
     base_repository: str = 'user'
 
-    @transaction_mode
     async def create_user(
         self,
         user: CreateUserRequest,
         company_id: UUID4,
     ) -> UserModel:
-        """Create user."""
+        """Create user, hashing the password before a database connection is taken."""
         user_data = user.model_dump()
         plain_password = user_data.pop('password')
-        user_data['hashed_password'] = hash_password(plain_password)
+        user_data['hashed_password'] = await hash_password_async(plain_password)
         user_data['company_id'] = company_id
+        return await self._add_user(user_data)
+
+    @transaction_mode
+    async def _add_user(self, user_data: dict) -> UserModel:
         return await self.uow.user.add_one_and_get_obj(**user_data)
 
     @transaction_mode
@@ -58,15 +60,27 @@ class UserService(BaseService):
                 status_code=HTTP_403_FORBIDDEN,
                 detail='Not allowed for other users',
             )
+        await self.uow.subdivision_stats.decrement_for_user(user_id)
         await self.uow.user.delete_by_query(id=user_id)
+        self.uow.add_after_commit(partial(auth_user_cache.invalidate, user_id))
 
     @transaction_mode
-    async def get_users_by_filters(self, filters: UserFilters) -> list[UserDB]:
-        """Get list of user by filters."""
-        users: Sequence[UserModel] = await self.uow.user.get_users_by_filter(filters)
-        return [user.to_pydantic_schema() for user in users]
+    async def get_users_by_filters(self, filters: UserFilters, current_user: UserSchema) -> Page[UserDB]:
+        """Get page of company users by filters."""
+        if not current_user.company_id:
+            raise HTTPException(
+                status_code=HTTP_403_FORBIDDEN,
+                detail='User is not a member of any company',
+            )
+        page: Page[UserModel] = await self.uow.user.get_users_by_filter(
+            filters, company_id=current_user.company_id,
+        )
+        return Page(
+            items=[user.to_pydantic_schema() for user in page.items],
+            next_cursor=page.next_cursor,
+            total_estimate=page.total_estimate,
+        )
 
-    @transaction_mode
     async def update_user(
         self,
         user_id: UUID4,
@@ -80,9 +94,14 @@ class UserService(BaseService):
                 detail='Not allowed for other users',
             )
         if 'password' in update_data:
-            update_data['hashed_password'] = hash_password(update_data.pop('password'))
+            update_data['hashed_password'] = await hash_password_async(update_data.pop('password'))
+        return await self._update_user(user_id, update_data)
+
+    @transaction_mode
+    async def _update_user(self, user_id: UUID4, update_data: dict) -> UserModel:
         user = await self.uow.user.update_one_by_id(obj_id=user_id, **update_data)
         self._check_user_exists(user)
+        self.uow.add_after_commit(partial(auth_user_cache.invalidate, user_id))
         return user
 
     @staticmethod
@@ -7,7 +7,7 @@ from starlette.status import HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
 from src.models import CompanyModel, UserModel
 from src.schemas.company import CompanyWithUsers
 from src.schemas.user import CreateUserRequest, UserSchema
-from src.utils.auth.jwt_tools import hash_password
+from src.utils.auth.password_hasher import hash_password_async
 from src.utils.service import BaseService
 from src.utils.unit_of_work import transaction_mode
 from utils.auth.validators import check_company_is_yours
@@ -49,18 +49,21 @@ class UserInCompanyService(BaseService):
             users=[user.to_pydantic_schema() for user in company.users],
         )
 
-    @transaction_mode
     async def create_user_in_company(
         self,
         user_request: CreateUserRequest,
         current_user: UserSchema,
         company_id: UUID4,
     ) -> UserModel:
-        """Create user in company."""
+        """Create user in company, hashing the password outside of the transaction."""
         check_company_is_yours(current_user, company_id)
         user_data = user_request.model_dump()
         await self._check_user_exists(user_data)
         plain_password = user_data.pop('password')
-        user_data['hashed_password'] = hash_password(plain_password)
+        user_data['hashed_password'] = await hash_password_async(plain_password)
         user_data['company_id'] = company_id
+        return await self._add_user(user_data)
+
+    @transaction_mode
+    async def _add_user(self, user_data: dict[str, Any]) -> UserModel:
         return await self.uow.user.add_one_and_get_obj(**user_data)
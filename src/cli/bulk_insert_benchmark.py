@@ -0,0 +1,72 @@
+"""Measure rows inserted per second by the repository bulk methods against a row-by-row loop.
+
+Every run is rolled back, nothing is left in the database.
+
+Usage: python -m src.cli.bulk_insert_benchmark [--rows N ...]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from loguru import logger
+
+from src.database import async_session_maker
+from src.repositories import OutboxRepository
+
+ROW_BY_ROW_MAX_ROWS = 10_000
+
+
+def make_rows(rows: int) -> list[dict[str, Any]]:
+    return [
+        {'topic': 'benchmark', 'recipient': f'user{number}@example.com', 'payload': {'number': number}}
+        for number in range(rows)
+    ]
+
+
+async def rate(rows: list[dict[str, Any]], func: Callable[[OutboxRepository], Awaitable[object]]) -> float:
+    async with async_session_maker() as session:
+        try:
+            started_at = time.perf_counter()
+            await func(OutboxRepository(session))
+            return len(rows) / (time.perf_counter() - started_at)
+        finally:
+            await session.rollback()
+
+
+async def add_one_by_one(repository: OutboxRepository, rows: list[dict[str, Any]]) -> None:
+    for row in rows:
+        await repository.add_one(**row)
+
+
+async def add_copy(repository: OutboxRepository, rows: list[dict[str, Any]]) -> None:
+    repository.bulk_copy_threshold = 0
+    await repository.add_many(rows)
+
+
+async def benchmark(rows_count: int) -> dict[str, float]:
+    rows = make_rows(rows_count)
+    results = {}
+    if rows_count <= ROW_BY_ROW_MAX_ROWS:
+        results['add_one loop'] = await rate(rows, lambda repository: add_one_by_one(repository, rows))
+    results['add_many VALUES'] = await rate(
+        rows, lambda repository: repository.add_many(rows, returning=True),
+    )
+    results['add_many COPY'] = await rate(rows, lambda repository: add_copy(repository, rows))
+    return results
+
+
+async def main(rows_counts: list[int]) -> None:
+    for rows_count in rows_counts:
+        results = await benchmark(rows_count)
+        summary = ', '.join(f'{name}: {value:.0f}/s' for name, value in results.items())
+        logger.info(f'{rows_count} rows {summary}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure rows inserted per second by bulk methods.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 100_000])
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
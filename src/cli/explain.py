@@ -0,0 +1,71 @@
+"""Run repository queries under ``EXPLAIN`` to check which indexes the planner picks."""
+
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import ClauseElement, Executable, Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+
+
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Executable) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kwargs: Any) -> str:
+    return f'EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}'
+
+
+def plan_indexes(plan: dict[str, Any]) -> set[str]:
+    """Collect names of the indexes scanned by a JSON plan node and its children."""
+    indexes = {plan['Index Name']} if 'Index Name' in plan else set()
+    for child in plan.get('Plans', []):
+        indexes |= plan_indexes(child)
+    return indexes
+
+
+class ExplainSession:
+    """Session wrapper explaining statements instead of running them, repositories accept it as is.
+
+    Indexes used by every explained statement are appended to ``indexes``.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.indexes: list[set[str]] = []
+
+    async def execute(self, statement: Executable) -> Result:
+        result = await self.session.execute(Explain(statement))
+        frozen = result.freeze()
+        plan = frozen().scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        self.indexes.append(plan_indexes(plan[0]['Plan']))
+        return frozen()
+
+
+async def check_indexes(
+    session: ExplainSession, checks: Mapping[str, tuple[Callable[[], Awaitable[object]], set[str]]],
+) -> bool:
+    """Run every check through the explaining session and log the indexes its last statement used.
+
+    Returns whether each check used at least one of its expected indexes.
+    """
+    passed = True
+    for name, (run, expected) in checks.items():
+        await run()
+        used = session.indexes[-1]
+        if used & expected:
+            logger.info(f'{name}: {", ".join(sorted(used))}')
+        else:
+            expected_names = ', '.join(sorted(expected))
+            logger.error(f'{name}: expected one of {expected_names}, used {used or "no index"}')
+            passed = False
+    return passed
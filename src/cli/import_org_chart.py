@@ -0,0 +1,36 @@
+"""Import subdivisions of company from CSV or JSON file.
+
+Usage: python -m src.cli.import_org_chart <company_id> <path to .csv or .json>
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from uuid import UUID
+
+from loguru import logger
+
+from src.api.v1.services.subdivision import SubdivisionService
+from src.utils.org_chart_import import OrgChartRow, parse_org_chart_csv, parse_org_chart_json
+
+
+def read_org_chart(file_path: Path) -> list[OrgChartRow]:
+    content = file_path.read_bytes()
+    if file_path.suffix == '.json':
+        return parse_org_chart_json(content)
+    return parse_org_chart_csv(content.decode())
+
+
+async def import_org_chart(company_id: UUID, rows: list[OrgChartRow]) -> None:
+    result = await SubdivisionService().import_subdivisions(company_id=company_id, rows=rows)
+    for error in result.errors:
+        logger.warning(f'Row {error.row} ({error.name}): {error.detail}')
+    logger.info(f'Imported {result.created} of {len(rows)} subdivisions')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Import subdivisions of company from CSV or JSON file.')
+    parser.add_argument('company_id', type=UUID)
+    parser.add_argument('file_path', type=Path)
+    args = parser.parse_args()
+    asyncio.run(import_org_chart(args.company_id, read_org_chart(args.file_path)))
@@ -0,0 +1,55 @@
+"""Measure JWT tokens issued and verified per second for every supported algorithm.
+
+Usage: python -m src.cli.jwt_benchmark [--tokens N]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+from loguru import logger
+
+PRIVATE_KEY_FACTORIES: dict[str, Callable[[], PrivateKeyTypes]] = {
+    'RS256': lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    'ES256': lambda: ec.generate_private_key(ec.SECP256R1()),
+    'EdDSA': ed25519.Ed25519PrivateKey.generate,
+}
+PAYLOAD = {'sub': 'benchmark', 'type': 'access', 'exp': 4102444800}
+
+
+def rate(tokens: int, func: Callable[[], object]) -> float:
+    started_at = time.perf_counter()
+    for _ in range(tokens):
+        func()
+    return tokens / (time.perf_counter() - started_at)
+
+
+def benchmark(algorithm: str, tokens: int) -> dict[str, float]:
+    private_key = PRIVATE_KEY_FACTORIES[algorithm]()
+    public_key = private_key.public_key()
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption(),
+    ).decode()
+    public_pem = public_key.public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    token = jwt.encode(PAYLOAD, private_key, algorithm=algorithm)
+    return {
+        'issue (PEM)': rate(tokens, lambda: jwt.encode(PAYLOAD, private_pem, algorithm=algorithm)),
+        'issue (key)': rate(tokens, lambda: jwt.encode(PAYLOAD, private_key, algorithm=algorithm)),
+        'verify (PEM)': rate(tokens, lambda: jwt.decode(token, public_pem, algorithms=[algorithm])),
+        'verify (key)': rate(tokens, lambda: jwt.decode(token, public_key, algorithms=[algorithm])),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure JWT tokens issued and verified per second.')
+    parser.add_argument('--tokens', type=int, default=1000)
+    args = parser.parse_args()
+    for algorithm in PRIVATE_KEY_FACTORIES:
+        results = benchmark(algorithm, args.tokens)
+        logger.info(f'{algorithm} ' + ', '.join(f'{name}: {value:.0f}/s' for name, value in results.items()))
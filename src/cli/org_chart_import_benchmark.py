@@ -0,0 +1,88 @@
+"""Measure rows per second through every stage of the org chart import.
+
+Parsing and planning run in memory, the load stage runs the bulk COPY insert into a new company
+and is rolled back, nothing is left in the database.
+
+Usage: python -m src.cli.org_chart_import_benchmark [--rows N ...]
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import time
+from collections.abc import Callable
+
+import orjson
+from loguru import logger
+
+from src.database import async_session_maker
+from src.repositories import CompanyRepository, SubdivisionRepository
+from src.utils.org_chart_import import (
+    OrgChartImportPlan,
+    parse_org_chart_csv,
+    parse_org_chart_json,
+    plan_org_chart_import,
+)
+
+FANOUT = 10
+
+
+def make_items(rows: int) -> list[dict[str, str]]:
+    return [
+        {'name': f'n{number}', 'parent': f'n{(number - 1) // FANOUT}' if number else ''}
+        for number in range(rows)
+    ]
+
+
+def make_csv(items: list[dict[str, str]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=('name', 'parent'))
+    writer.writeheader()
+    writer.writerows(items)
+    return buffer.getvalue()
+
+
+def rate(rows: int, func: Callable[[], object]) -> float:
+    started_at = time.perf_counter()
+    func()
+    return rows / (time.perf_counter() - started_at)
+
+
+async def load_rate(plan: OrgChartImportPlan) -> float:
+    async with async_session_maker() as session:
+        try:
+            company_id = await CompanyRepository(session).add_one_and_get_id(company_name='benchmark')
+            started_at = time.perf_counter()
+            await SubdivisionRepository(session).copy_subdivisions(company_id, plan.records)
+            return len(plan.records) / (time.perf_counter() - started_at)
+        finally:
+            await session.rollback()
+
+
+async def benchmark(rows_count: int) -> dict[str, float]:
+    items = make_items(rows_count)
+    csv_content = make_csv(items)
+    json_content = orjson.dumps(items)
+    rows = parse_org_chart_csv(csv_content)
+    plan = plan_org_chart_import(rows, {})
+    return {
+        'parse CSV': rate(rows_count, lambda: parse_org_chart_csv(csv_content)),
+        'parse JSON': rate(rows_count, lambda: parse_org_chart_json(json_content)),
+        'plan': rate(rows_count, lambda: plan_org_chart_import(rows, {})),
+        'load': await load_rate(plan),
+    }
+
+
+async def main(rows_counts: list[int]) -> None:
+    for rows_count in rows_counts:
+        results = await benchmark(rows_count)
+        summary = ', '.join(f'{name}: {value:.0f}/s' for name, value in results.items())
+        logger.info(f'{rows_count} rows {summary}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure rows per second through the org chart import.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 100_000])
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
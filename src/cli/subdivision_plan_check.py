@@ -0,0 +1,64 @@
+"""Check that the subdivision tree lookups are served by indexes rather than sequential scans.
+
+A company with a generated tree is loaded, analyzed and every lookup is run under ``EXPLAIN``.
+The run is rolled back, nothing is left in the database. Exits with status 1 when a lookup
+does not use any of its expected indexes.
+
+Usage: python -m src.cli.subdivision_plan_check [--nodes N]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import text
+from sqlalchemy_utils import Ltree
+
+from src.cli.explain import ExplainSession, check_indexes
+from src.cli.subtree_rename_benchmark import make_records
+from src.database import async_session_maker
+from src.repositories import CompanyRepository, SubdivisionRepository
+
+SUBTREE_PATH = Ltree('root.n1.n11')
+LEAF_NAME = 'node 111'
+SUBTREE_INDEXES = {'ix_subdivision_path_gist', 'ix_subdivision_company_id_path'}
+
+
+async def main(nodes: int) -> bool:
+    async with async_session_maker() as session:
+        try:
+            company_id = await CompanyRepository(session).add_one_and_get_id(company_name='plan check')
+            await SubdivisionRepository(session).copy_subdivisions(company_id, make_records(nodes))
+            await session.execute(text('ANALYZE subdivision'))
+            leaf = await SubdivisionRepository(session).get_by_query_one_or_none(
+                company_id=company_id, name=LEAF_NAME,
+            )
+            explain_session = ExplainSession(session)
+            repository = SubdivisionRepository(explain_session)
+            return await check_indexes(
+                explain_session,
+                {
+                    'get_all_path_of_parent': (
+                        lambda: repository.get_all_path_of_parent(company_id, LEAF_NAME),
+                        {'unique_subdivision_name'},
+                    ),
+                    'get_subtree_stats': (
+                        lambda: repository.get_subtree_stats(company_id, SUBTREE_PATH),
+                        SUBTREE_INDEXES,
+                    ),
+                    'get_ancestor_chains': (
+                        lambda: repository.get_ancestor_chains(company_id, [leaf.id]),
+                        SUBTREE_INDEXES,
+                    ),
+                },
+            )
+        finally:
+            await session.rollback()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check indexes used by the subdivision tree lookups.')
+    parser.add_argument('--nodes', type=int, default=100_000)
+    args = parser.parse_args()
+    if not asyncio.run(main(args.nodes)):
+        sys.exit(1)
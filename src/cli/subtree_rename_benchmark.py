@@ -0,0 +1,76 @@
+"""Measure how long moving a subtree takes with the single path UPDATE against a row-by-row loop.
+
+Every run is rolled back, nothing is left in the database.
+
+Usage: python -m src.cli.subtree_rename_benchmark [--nodes N ...]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+from pydantic import UUID4
+from sqlalchemy import text
+from sqlalchemy_utils import Ltree
+
+from src.database import async_session_maker
+from src.repositories import CompanyRepository, SubdivisionRepository
+
+FANOUT = 10
+ROW_BY_ROW_MAX_NODES = 10_000
+OLD_ROOT = Ltree('root')
+NEW_ROOT = Ltree('renamed')
+
+
+def make_records(nodes: int) -> list[tuple[str, str]]:
+    paths = [str(OLD_ROOT)]
+    for number in range(1, nodes):
+        paths.append(f'{paths[(number - 1) // FANOUT]}.n{number}')
+    return [(f'node {number}', path) for number, path in enumerate(paths)]
+
+
+async def elapsed(nodes: int, func: Callable[[SubdivisionRepository, UUID4], Awaitable[object]]) -> float:
+    async with async_session_maker() as session:
+        try:
+            company_id = await CompanyRepository(session).add_one_and_get_id(company_name='benchmark')
+            repository = SubdivisionRepository(session)
+            await repository.copy_subdivisions(company_id, make_records(nodes))
+            await session.execute(text('ANALYZE subdivision'))
+            started_at = time.perf_counter()
+            await func(repository, company_id)
+            return time.perf_counter() - started_at
+        finally:
+            await session.rollback()
+
+
+async def rename_one_by_one(repository: SubdivisionRepository, company_id: UUID4) -> None:
+    rows = [row async for row in repository.stream_subtree(company_id, OLD_ROOT)]
+    for row in rows:
+        path = NEW_ROOT if row.path == OLD_ROOT else NEW_ROOT + row.path[1:]
+        await repository.update_one_by_id(row.id, path=path)
+
+
+async def benchmark(nodes: int) -> dict[str, float]:
+    results = {}
+    if nodes <= ROW_BY_ROW_MAX_NODES:
+        results['update_one_by_id loop'] = await elapsed(nodes, rename_one_by_one)
+    results['rewrite_subtree_path'] = await elapsed(
+        nodes, lambda repository, company_id: repository.rewrite_subtree_path(company_id, OLD_ROOT, NEW_ROOT),
+    )
+    return results
+
+
+async def main(nodes_counts: list[int]) -> None:
+    for nodes in nodes_counts:
+        results = await benchmark(nodes)
+        summary = ', '.join(f'{name}: {value * 1000:.1f} ms' for name, value in results.items())
+        logger.info(f'{nodes} nodes {summary}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure how long moving a subtree takes.')
+    parser.add_argument('--nodes', type=int, nargs='+', default=[1_000, 100_000])
+    args = parser.parse_args()
+    asyncio.run(main(args.nodes))
@@ -0,0 +1,70 @@
+"""Check that the user lookups are served by indexes rather than sequential scans.
+
+Users of a new company are loaded, analyzed and every lookup is run under ``EXPLAIN``.
+The run is rolled back, nothing is left in the database. Exits with status 1 when a lookup
+does not use any of its expected indexes.
+
+Usage: python -m src.cli.user_plan_check [--users N]
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Any
+
+from pydantic import UUID4
+from sqlalchemy import text
+
+from src.cli.explain import ExplainSession, check_indexes
+from src.database import async_session_maker
+from src.repositories import CompanyRepository, UserRepository
+
+LOOKUP_NUMBER = 42
+
+
+def make_users(company_id: UUID4, users: int) -> list[dict[str, Any]]:
+    return [
+        {
+            'username': f'user{number}',
+            'first_name': f'First{number}',
+            'last_name': f'Last{number}',
+            'email': f'user{number}@example.com',
+            'hashed_password': b'\0' * 60,
+            'company_id': company_id,
+            'active': True,
+        }
+        for number in range(users)
+    ]
+
+
+async def main(users: int) -> bool:
+    async with async_session_maker() as session:
+        try:
+            company_id = await CompanyRepository(session).add_one_and_get_id(company_name='plan check')
+            await UserRepository(session).add_many(make_users(company_id, users))
+            await session.execute(text('ANALYZE "user"'))
+            explain_session = ExplainSession(session)
+            repository = UserRepository(explain_session)
+            return await check_indexes(
+                explain_session,
+                {
+                    'get_by_query_one_or_none(email)': (
+                        lambda: repository.get_by_query_one_or_none(email=f'User{LOOKUP_NUMBER}@Example.com'),
+                        {'ix_user_email_lower'},
+                    ),
+                    'get_by_query_one_or_none(username)': (
+                        lambda: repository.get_by_query_one_or_none(username=f'USER{LOOKUP_NUMBER}'),
+                        {'ix_user_username_lower'},
+                    ),
+                },
+            )
+        finally:
+            await session.rollback()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check indexes used by the user lookups.')
+    parser.add_argument('--users', type=int, default=100_000)
+    args = parser.parse_args()
+    if not asyncio.run(main(args.users)):
+        sys.exit(1)
@@ -0,0 +1,86 @@
+"""Measure user searches per second and check the indexes each search term is served by.
+
+Users of a new company are loaded and analyzed, every search is timed and then run under ``EXPLAIN``:
+terms of at least three characters must use the pg_trgm GIN indexes, shorter ones the keyset index.
+The run is rolled back, nothing is left in the database. Exits with status 1 when a search
+does not use any of its expected indexes.
+
+Usage: python -m src.cli.user_search_benchmark [--users N] [--queries N]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+from pydantic import UUID4
+from sqlalchemy import text
+
+from src.cli.explain import ExplainSession, check_indexes
+from src.cli.user_plan_check import make_users
+from src.database import async_session_maker
+from src.repositories import CompanyRepository, UserRepository
+from src.repositories.user import TRIGRAM_MIN_LENGTH
+from src.schemas.user import UserFilters
+
+TERMS = ('us', 'user4242', 'usr4242', 'Last42')
+TRIGRAM_INDEXES = {f'ix_user_{column}_trgm' for column in UserRepository.search_columns}
+KEYSET_INDEXES = {'ix_user_company_id_last_name_first_name_id'}
+
+
+def make_filters(like: str) -> UserFilters:
+    return UserFilters(
+        page=None,
+        per_page=100,
+        cursor=None,
+        with_total=False,
+        like=like,
+        ids=None,
+        first_name=None,
+        last_name=None,
+        middle_name=None,
+    )
+
+
+async def rate(repository: UserRepository, company_id: UUID4, like: str, queries: int) -> float:
+    filters = make_filters(like)
+    started_at = time.perf_counter()
+    for _ in range(queries):
+        await repository.get_users_by_filter(filters, company_id)
+    return queries / (time.perf_counter() - started_at)
+
+
+async def main(users: int, queries: int) -> bool:
+    async with async_session_maker() as session:
+        try:
+            company_id = await CompanyRepository(session).add_one_and_get_id(company_name='benchmark')
+            await UserRepository(session).add_many(make_users(company_id, users))
+            await session.execute(text('ANALYZE "user"'))
+            results = {like: await rate(UserRepository(session), company_id, like, queries) for like in TERMS}
+            summary = ', '.join(f'{like!r}: {value:.0f}/s' for like, value in results.items())
+            logger.info(f'{users} users {summary}')
+
+            explain_session = ExplainSession(session)
+            repository = UserRepository(explain_session)
+            return await check_indexes(
+                explain_session,
+                {
+                    f'like={like!r}': (
+                        lambda like=like: repository.get_users_by_filter(make_filters(like), company_id),
+                        TRIGRAM_INDEXES if len(like) >= TRIGRAM_MIN_LENGTH else KEYSET_INDEXES,
+                    )
+                    for like in TERMS
+                },
+            )
+        finally:
+            await session.rollback()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure user searches per second and check their indexes.')
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=100)
+    args = parser.parse_args()
+    if not asyncio.run(main(args.users, args.queries)):
+        sys.exit(1)
@@ -12,9 +12,12 @@ BASE_DIR = Path(__file__).parent.parent
 class AuthJWT(BaseModel):
     private_key_path: Path = BASE_DIR / 'certs' / 'jwt-private.pem'
     public_key_path: Path = BASE_DIR / 'certs' / 'jwt-public.pem'
-    algorithm: str = 'RS256'
+    public_keys_dir: Path = BASE_DIR / 'certs' / 'public'
+    key_reload_interval_seconds: float = float(os.environ.get('JWT_KEY_RELOAD_INTERVAL_SECONDS', '60'))
+    algorithm: str = os.environ.get('JWT_ALGORITHM', 'RS256')
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
+    stateless_access_tokens: bool = os.environ.get('AUTH_STATELESS_ACCESS_TOKENS', 'false').lower() == 'true'
 
 
 class EmailSettings(BaseModel):
@@ -23,6 +26,66 @@ class EmailSettings(BaseModel):
     smtp_username: str = os.environ.get('SMTP_USERNAME')
     smtp_password: str = os.environ.get('SMTP_PASSWORD')
     from_email: str = os.environ.get('FROM_EMAIL')
+    smtp_start_tls: bool = os.environ.get('SMTP_START_TLS', 'true').lower() == 'true'
+    smtp_timeout_seconds: float = float(os.environ.get('SMTP_TIMEOUT_SECONDS', '30'))
+    smtp_pool_size: int = int(os.environ.get('SMTP_POOL_SIZE', '2'))
+    queue_max_size: int = int(os.environ.get('MAIL_QUEUE_MAX_SIZE', '10000'))
+    send_attempts: int = int(os.environ.get('MAIL_SEND_ATTEMPTS', '5'))
+    retry_base_delay_seconds: float = float(os.environ.get('MAIL_RETRY_BASE_DELAY_SECONDS', '1'))
+
+
+class OrgTreeCacheSettings(BaseModel):
+    max_companies: int = int(os.environ.get('ORG_TREE_CACHE_MAX_COMPANIES', '1024'))
+    ttl_seconds: float = float(os.environ.get('ORG_TREE_CACHE_TTL_SECONDS', '60'))
+
+
+class SubdivisionStatsSettings(BaseModel):
+    use_counters: bool = os.environ.get('SUBDIVISION_STATS_USE_COUNTERS', 'false').lower() == 'true'
+
+
+class SubdivisionTreeLockSettings(BaseModel):
+    slow_wait_seconds: float = float(os.environ.get('SUBDIVISION_TREE_LOCK_SLOW_WAIT_SECONDS', '1'))
+
+
+class TransactionRetrySettings(BaseModel):
+    attempts: int = int(os.environ.get('TRANSACTION_RETRY_ATTEMPTS', '3'))
+    base_delay_seconds: float = float(os.environ.get('TRANSACTION_RETRY_BASE_DELAY_SECONDS', '0.05'))
+
+
+class PasswordHashingSettings(BaseModel):
+    rounds: int = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+    max_workers: int = int(os.environ.get('PASSWORD_HASHER_MAX_WORKERS', '4'))
+    max_pending: int = int(os.environ.get('PASSWORD_HASHER_MAX_PENDING', '64'))
+    queue_timeout_seconds: float = float(os.environ.get('PASSWORD_HASHER_QUEUE_TIMEOUT_SECONDS', '5'))
+
+
+class AuthUserCacheSettings(BaseModel):
+    max_users: int = int(os.environ.get('AUTH_USER_CACHE_MAX_USERS', '10000'))
+    ttl_seconds: float = float(os.environ.get('AUTH_USER_CACHE_TTL_SECONDS', '30'))
+
+
+class OutboxSettings(BaseModel):
+    batch_size: int = int(os.environ.get('OUTBOX_BATCH_SIZE', '100'))
+    poll_interval_seconds: float = float(os.environ.get('OUTBOX_POLL_INTERVAL_SECONDS', '1'))
+    lease_seconds: float = float(os.environ.get('OUTBOX_LEASE_SECONDS', '300'))
+    max_attempts: int = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', '5'))
+    retry_base_delay_seconds: float = float(os.environ.get('OUTBOX_RETRY_BASE_DELAY_SECONDS', '30'))
+    delivery_timeout_seconds: float = float(os.environ.get('OUTBOX_DELIVERY_TIMEOUT_SECONDS', '120'))
+    retention_seconds: float = float(os.environ.get('OUTBOX_RETENTION_SECONDS', '86400'))
+    prune_interval_seconds: float = float(os.environ.get('OUTBOX_PRUNE_INTERVAL_SECONDS', '300'))
+
+
+class RepositoryBulkSettings(BaseModel):
+    batch_size: int = int(os.environ.get('REPOSITORY_BULK_BATCH_SIZE', '1000'))
+    copy_threshold: int = int(os.environ.get('REPOSITORY_BULK_COPY_THRESHOLD', '10000'))
+
+
+class OrgChartImportSettings(BaseModel):
+    max_file_size_bytes: int = int(os.environ.get('ORG_CHART_IMPORT_MAX_FILE_SIZE_BYTES', '10485760'))
+
+
+class PaginationSettings(BaseModel):
+    count_limit: int = int(os.environ.get('PAGINATION_COUNT_LIMIT', '10000'))
 
 
 class Settings:
@@ -37,6 +100,16 @@ class Settings:
     DB_URL: str = f'postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
     auth_jwt: AuthJWT = AuthJWT()
     email: EmailSettings = EmailSettings()
+    org_tree_cache: OrgTreeCacheSettings = OrgTreeCacheSettings()
+    subdivision_stats: SubdivisionStatsSettings = SubdivisionStatsSettings()
+    subdivision_tree_lock: SubdivisionTreeLockSettings = SubdivisionTreeLockSettings()
+    transaction_retry: TransactionRetrySettings = TransactionRetrySettings()
+    password_hashing: PasswordHashingSettings = PasswordHashingSettings()
+    auth_user_cache: AuthUserCacheSettings = AuthUserCacheSettings()
+    outbox: OutboxSettings = OutboxSettings()
+    repository_bulk: RepositoryBulkSettings = RepositoryBulkSettings()
+    pagination: PaginationSettings = PaginationSettings()
+    org_chart_import: OrgChartImportSettings = OrgChartImportSettings()
 
 
 settings = Settings()
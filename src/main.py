@@ -1,4 +1,6 @@
 import os
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
 from dotenv import find_dotenv, load_dotenv
 from fastapi import FastAPI
@@ -6,6 +8,23 @@ from fastapi.responses import ORJSONResponse
 
 from src.api import router
 from src.metadata import DESCRIPTION, TAG_METADATA, TITLE, VERSION
+from src.utils.auth.password_hasher import password_hasher
+from src.utils.mail import mail_queue
+from src.utils.outbox import outbox_dispatcher, outbox_pruner
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
+    mail_queue.start()
+    outbox_dispatcher.start()
+    outbox_pruner.start()
+    try:
+        yield
+    finally:
+        await outbox_pruner.stop()
+        await outbox_dispatcher.stop()
+        await mail_queue.stop()
+        password_hasher.shutdown()
 
 
 def create_fast_api_app() -> FastAPI:
@@ -19,6 +38,7 @@ def create_fast_api_app() -> FastAPI:
             description=DESCRIPTION,
             version=VERSION,
             openapi_tags=TAG_METADATA,
+            lifespan=lifespan,
         )
     else:
         fastapi_app = FastAPI(
@@ -27,6 +47,7 @@ def create_fast_api_app() -> FastAPI:
             description=DESCRIPTION,
             version=VERSION,
             openapi_tags=TAG_METADATA,
+            lifespan=lifespan,
             docs_url=None,
             redoc_url=None,
         )
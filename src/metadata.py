@@ -27,6 +27,10 @@ TAG_METADATA = [
         'name': 'Healthz',
         'description': 'Standard health check.',
     },
+    {
+        'name': 'Metrics',
+        'description': 'In-process metrics of the current worker.',
+    },
 ]
 
 TITLE = 'API business control system'
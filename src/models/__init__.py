@@ -1,17 +1,21 @@
 __all__ = [
     'BaseModel',
     'CompanyModel',
+    'OutboxModel',
     'PositionAssignmentModel',
     'PositionInSubdivisionModel',
     'PositionModel',
     'SubdivisionModel',
+    'SubdivisionStatsModel',
     'UserModel',
 ]
 
 from src.models.base import BaseModel
 from src.models.company import CompanyModel
+from src.models.outbox import OutboxModel
 from src.models.position import PositionModel
 from src.models.position_in_subdivision import PositionInSubdivisionModel
 from src.models.subdivision import SubdivisionModel
+from src.models.subdivision_stats import SubdivisionStatsModel
 from src.models.user import UserModel
 from src.models.user_in_position import PositionAssignmentModel
@@ -0,0 +1,32 @@
+from typing import Any
+
+from sqlalchemy import UUID, BigInteger, DateTime, Enum, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models import BaseModel
+from src.schemas.outbox import OutboxStatus
+from src.utils.custom_types import created_at, dt_now_utc_sql, updated_at
+
+
+class OutboxModel(BaseModel):
+    __tablename__ = 'outbox'
+    __table_args__ = (
+        Index('ix_outbox_pending', 'available_at', 'id', postgresql_where=text("status = 'PENDING'")),
+        Index('ix_outbox_job_id', 'job_id'),
+        Index('ix_outbox_settled_updated_at', 'updated_at', postgresql_where=text("status <> 'PENDING'")),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    topic: Mapped[str] = mapped_column(String(50), nullable=False)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
+    job_id: Mapped[UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    status: Mapped[OutboxStatus] = mapped_column(
+        Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING, server_default='PENDING',
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    available_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=dt_now_utc_sql)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[created_at]
+    updated_at: Mapped[updated_at]
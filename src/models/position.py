@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models import BaseModel
@@ -20,6 +20,7 @@ class PositionModel(BaseModel):
             'subdivision_id',
             name='unique_position_in_subdivision_name',
         ),
+        Index('ix_position_subdivision_id_title_id', 'subdivision_id', 'title', 'id'),
     )
 
     id: Mapped[integer_pk]
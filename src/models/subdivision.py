@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy_utils import Ltree, LtreeType
@@ -23,6 +23,8 @@ class SubdivisionModel(BaseModel):
             'company_id',
             name='unique_subdivision_name',
         ),
+        Index('ix_subdivision_path_gist', 'path', postgresql_using='gist'),
+        Index('ix_subdivision_company_id_path', 'company_id', 'path'),
     )
 
     id: Mapped[integer_pk]
@@ -0,0 +1,21 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models import BaseModel
+from src.schemas.subdivision import SubdivisionStatsDB
+from src.utils.custom_types import updated_at
+
+
+class SubdivisionStatsModel(BaseModel):
+    __tablename__ = 'subdivision_stats'
+
+    subdivision_id: Mapped[int] = mapped_column(
+        ForeignKey('subdivision.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    positions_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    headcount: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    updated_at: Mapped[updated_at]
+
+    def to_pydantic_schema(self) -> SubdivisionStatsDB:
+        return SubdivisionStatsDB(**self.__dict__)
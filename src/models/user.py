@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, Boolean, Enum, ForeignKey, LargeBinary, String
+from sqlalchemy import UUID, Boolean, Enum, ForeignKey, Index, LargeBinary, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models import BaseModel
@@ -15,13 +15,27 @@ if TYPE_CHECKING:
 
 class UserModel(CompanyMixin, BaseModel):
     __tablename__ = 'user'
+    __table_args__ = (
+        Index('ix_user_username_lower', text('lower(username)'), unique=True),
+        Index('ix_user_email_lower', text('lower(email)'), unique=True),
+        Index('ix_user_company_id_last_name_first_name_id', 'company_id', 'last_name', 'first_name', 'id'),
+        *(
+            Index(
+                f'ix_user_{column}_trgm',
+                column,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+            for column in ('username', 'first_name', 'last_name', 'middle_name', 'email')
+        ),
+    )
 
     id: Mapped[uuid_pk]
-    username: Mapped[str] = mapped_column(String(50), unique=True)
+    username: Mapped[str] = mapped_column(String(50))
     first_name: Mapped[str] = mapped_column(String(50))
     last_name: Mapped[str] = mapped_column(String(50))
     middle_name: Mapped[str | None] = mapped_column(String(50), default=None)
-    email: Mapped[str] = mapped_column(String(50), default=None, unique=True)
+    email: Mapped[str] = mapped_column(String(50), default=None)
     hashed_password: Mapped[bytes] = mapped_column(LargeBinary(60), nullable=False)
     role: Mapped[UserRole | None] = mapped_column(Enum(UserRole))
     company_id: Mapped[UUID | None] = mapped_column(
@@ -1,15 +1,19 @@
 __all__ = [
     'CompanyRepository',
+    'OutboxRepository',
     'PositionAssignmentRepository',
     'PositionInSubdivisionRepository',
     'PositionRepository',
     'SubdivisionRepository',
+    'SubdivisionStatsRepository',
     'UserRepository',
 ]
 
 from src.repositories.company import CompanyRepository
+from src.repositories.outbox import OutboxRepository
 from src.repositories.position import PositionRepository
 from src.repositories.position_in_subdivision import PositionInSubdivisionRepository
 from src.repositories.subdivision import SubdivisionRepository
+from src.repositories.subdivision_stats import SubdivisionStatsRepository
 from src.repositories.user import UserRepository
 from src.repositories.user_in_position import PositionAssignmentRepository
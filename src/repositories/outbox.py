@@ -0,0 +1,122 @@
+from collections.abc import Sequence
+from datetime import timedelta
+
+from pydantic import UUID4
+from sqlalchemy import (
+    ColumnElement,
+    Interval,
+    Result,
+    and_,
+    case,
+    delete,
+    func,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+
+from src.models.outbox import OutboxModel
+from src.schemas.outbox import OutboxStatus
+from src.utils.custom_types import dt_now_utc_sql
+from src.utils.repository import SqlAlchemyRepository
+
+
+def _after(seconds: float) -> ColumnElement:
+    return dt_now_utc_sql + literal(timedelta(seconds=seconds), Interval())
+
+
+class OutboxRepository(SqlAlchemyRepository):
+    model = OutboxModel
+
+    async def claim_batch(self, limit: int, lease_seconds: float) -> Sequence[OutboxModel]:
+        """Lease up to ``limit`` due messages, skipping rows being claimed by other dispatchers.
+
+        Claimed messages become due again after ``lease_seconds`` unless they are marked sent or failed,
+        so messages of a dispatcher that died are picked up by another one.
+        """
+        due_ids = (
+            select(self.model.id)
+            .where(self.model.status == OutboxStatus.PENDING, self.model.available_at <= dt_now_utc_sql)
+            .order_by(self.model.available_at, self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            update(self.model)
+            .where(self.model.id.in_(due_ids))
+            .values(
+                available_at=_after(lease_seconds),
+                attempts=self.model.attempts + 1,
+            )
+            .returning(self.model)
+        )
+        res: Result = await self.session.execute(query)
+        return res.scalars().all()
+
+    def _held(self, messages: Sequence[OutboxModel]) -> ColumnElement:
+        """Match claimed messages whose lease was not taken over, a new claim increments ``attempts``."""
+        leases = [(message.id, message.attempts) for message in messages]
+        return and_(
+            tuple_(self.model.id, self.model.attempts).in_(leases),
+            self.model.status == OutboxStatus.PENDING,
+        )
+
+    async def mark_sent(self, messages: Sequence[OutboxModel]) -> None:
+        if messages:
+            query = (
+                update(self.model)
+                .where(self._held(messages))
+                .values(status=OutboxStatus.SENT, last_error=None)
+            )
+            await self.session.execute(query)
+
+    async def mark_failed(
+        self, message: OutboxModel, error: str, retry_delay: float, max_attempts: int,
+    ) -> None:
+        """Schedule another delivery attempt after ``retry_delay`` or give up after ``max_attempts``."""
+        status_type = self.model.status.type
+        query = (
+            update(self.model)
+            .where(self._held([message]))
+            .values(
+                status=case(
+                    (self.model.attempts >= max_attempts, literal(OutboxStatus.FAILED, status_type)),
+                    else_=literal(OutboxStatus.PENDING, status_type),
+                ),
+                available_at=_after(retry_delay),
+                last_error=error,
+            )
+        )
+        await self.session.execute(query)
+
+    async def delete_settled(self, older_than_seconds: float, limit: int) -> int:
+        """Delete up to ``limit`` sent or failed messages not updated for ``older_than_seconds``."""
+        settled_ids = (
+            select(self.model.id)
+            .where(
+                self.model.status != OutboxStatus.PENDING,
+                self.model.updated_at < _after(-older_than_seconds),
+            )
+            .limit(limit)
+        )
+        query = delete(self.model).where(self.model.id.in_(settled_ids))
+        res: Result = await self.session.execute(query)
+        return res.rowcount
+
+    async def get_lag_seconds(self) -> float:
+        """Get age of the oldest message that is not delivered yet."""
+        query = select(
+            func.coalesce(func.extract('epoch', dt_now_utc_sql - func.min(self.model.created_at)), 0),
+        ).where(self.model.status == OutboxStatus.PENDING)
+        res: Result = await self.session.execute(query)
+        return float(res.scalar_one())
+
+    async def get_job_messages(self, job_id: UUID4, company_id: UUID4) -> Sequence[OutboxModel]:
+        query = (
+            select(self.model)
+            .where(self.model.job_id == job_id, self.model.payload['company_id'].astext == str(company_id))
+            .order_by(self.model.id)
+        )
+        res: Result = await self.session.execute(query)
+        return res.scalars().all()
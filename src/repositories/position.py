@@ -1,7 +1,43 @@
+from typing import Any
 
+from pydantic import UUID4
+from sqlalchemy import Result, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models import SubdivisionModel
 from src.models.position import PositionModel
+from src.schemas.filter import BaseFilter
+from src.utils.pagination import Page
 from src.utils.repository import SqlAlchemyRepository
 
 
 class PositionRepository(SqlAlchemyRepository):
     model = PositionModel
+
+    async def get_position_in_company(self, position_id: int, company_id: UUID4) -> PositionModel | None:
+        """Find position by ID among positions of company subdivisions."""
+        query = (
+            select(self.model)
+            .join(SubdivisionModel, SubdivisionModel.id == self.model.subdivision_id)
+            .where(self.model.id == position_id, SubdivisionModel.company_id == company_id)
+        )
+        res: Result = await self.session.execute(query)
+        return res.scalar_one_or_none()
+
+    async def add_one_ignore_existing(self, **kwargs: Any) -> PositionModel | None:
+        """Create position, returning None when subdivision already has position with the same title."""
+        query = (
+            insert(self.model)
+            .values(**kwargs)
+            .on_conflict_do_nothing(constraint='unique_position_in_subdivision_name')
+            .returning(self.model)
+        )
+        res: Result = await self.session.execute(query)
+        return res.scalar_one_or_none()
+
+    async def get_subdivision_positions_page(
+        self, subdivision_id: int, filters: BaseFilter,
+    ) -> Page[PositionModel]:
+        """Get page of subdivision positions ordered by (title, id)."""
+        query = select(self.model).where(self.model.subdivision_id == subdivision_id)
+        return await self.get_page(filters, query, sort_columns=(self.model.title,))
@@ -1,55 +1,176 @@
-from collections.abc import Sequence
-from typing import Any
+from collections.abc import AsyncIterator, Sequence
 
-from sqlalchemy import Result, Row, select, text
+from pydantic import UUID4
+from sqlalchemy import Result, Row, func, select, text
+from sqlalchemy.orm import aliased
+from sqlalchemy_utils import Ltree
 
+from src.models import PositionAssignmentModel, PositionModel
 from src.models.subdivision import SubdivisionModel
 from src.utils.repository import SqlAlchemyRepository
 
 
 class SubdivisionRepository(SqlAlchemyRepository):
     model = SubdivisionModel
+    stream_batch_size: int = 1000
 
-    async def get_all_path_of_parent(self, parent: str) -> type(model) | None:
-        query = select(self.model.path).where(self.model.name == parent)
+    async def get_all_path_of_parent(self, company_id: UUID4, parent: str) -> Ltree | None:
+        query = select(self.model.path).where(
+            self.model.company_id == company_id,
+            self.model.name == parent,
+        )
         path: Result | None = await self.session.execute(query)
         return path.scalar_one_or_none()
 
-    async def get_children_paths(
-        self, subdivision_name: str,
-    ) -> Sequence[Row[tuple[Any, ...] | Any]]:
-        query = text(
-            'SELECT id, name, path '
-            'FROM subdivision '
-            'WHERE path <@ '
-            '(SELECT path '
-            'FROM subdivision '
-            'WHERE name = :node_name)',
-        ).params(node_name=subdivision_name)
-        result: Result = await self.session.execute(query)
-        child_nodes = result.fetchall()
-        return child_nodes
-
-    async def change_children_paths(
-        self, child_nodes: Sequence[Row[tuple[Any, ...] | Any]],
-    ) -> None:
-        node_name = child_nodes[0][1]
-        for child in child_nodes[1:]:
-            _child_id, child_name, child_path = child
-            new_path = child_path.replace(f'{node_name}.', '')
-            stmt = text(
-                'UPDATE subdivision SET path = :new_path WHERE name = :child_name',
-            ).params({'new_path': new_path, 'child_name': child_name})
-            await self.session.execute(stmt)
-
-    async def update_children_paths(
-        self, child_nodes: Sequence[Row[tuple[Any, ...] | Any]], new_path_name: str,
-    ) -> None:
-        node_name = child_nodes[0][1]
-        for child in child_nodes:
-            _child_id, child_name, child_path = child
-            new_path = child_path.replace(f'{node_name}', f'{new_path_name}')
-            stmt = text(
-                'UPDATE subdivision SET path = :new_path WHERE name = :child_name',
-            ).params({'new_path': new_path, 'child_name': child_name})
-            await self.session.execute(stmt)
+    async def lock_company_tree(self, company_id: UUID4) -> None:
+        """Serialize hierarchy mutations of company until the end of the current transaction."""
+        stmt = text('SELECT pg_advisory_xact_lock(hashtextextended(:lock_key, 0))').params(
+            lock_key=f'subdivision:{company_id}',
+        )
+        await self.session.execute(stmt)
+
+    async def get_company_tree_rows(self, company_id: UUID4) -> Sequence[Row]:
+        """Get id, name, path and manager of every subdivision of company ordered by path."""
+        query = (
+            select(self.model.id, self.model.name, self.model.path, self.model.manager_id)
+            .where(self.model.company_id == company_id)
+            .order_by(self.model.path)
+        )
+        res: Result = await self.session.execute(query)
+        return res.all()
+
+    async def get_ancestor_chains(self, company_id: UUID4, subdivision_ids: Sequence[int]) -> Sequence[Row]:
+        """Get ancestors of every given subdivision of company with one ``@>`` query.
+
+        Rows are ``(subdivision_id, id, name, path, manager_id)`` ordered top-level ancestor first,
+        a subdivision without ancestors yields a single row with empty ancestor columns.
+        """
+        node = aliased(self.model)
+        ancestor = aliased(self.model)
+        query = (
+            select(
+                node.id.label('subdivision_id'),
+                ancestor.id,
+                ancestor.name,
+                ancestor.path,
+                ancestor.manager_id,
+            )
+            .outerjoin(
+                ancestor,
+                (ancestor.company_id == node.company_id)
+                & ancestor.path.ancestor_of(node.path)
+                & (ancestor.id != node.id),
+            )
+            .where(node.company_id == company_id, node.id.in_(subdivision_ids))
+            .order_by(node.id, func.nlevel(ancestor.path))
+        )
+        res: Result = await self.session.execute(query)
+        return res.all()
+
+    async def get_subtree_stats(self, company_id: UUID4, path: Ltree) -> Row:
+        """Aggregate the subtree, returns ``(subdivisions_count, positions_count, headcount)``."""
+        query = (
+            select(
+                func.count(func.distinct(self.model.id)).label('subdivisions_count'),
+                func.count(func.distinct(PositionModel.id)).label('positions_count'),
+                func.count(PositionAssignmentModel.id).label('headcount'),
+            )
+            .outerjoin(PositionModel, PositionModel.subdivision_id == self.model.id)
+            .outerjoin(PositionAssignmentModel, PositionAssignmentModel.position_id == PositionModel.id)
+            .where(self.model.company_id == company_id, self.model.path.descendant_of(path))
+        )
+        res: Result = await self.session.execute(query)
+        return res.one()
+
+    async def get_company_stats(self, company_id: UUID4) -> Sequence[Row]:
+        """Get ``(id, name, path, positions_count, headcount)`` of every subdivision ordered by path."""
+        query = (
+            select(
+                self.model.id,
+                self.model.name,
+                self.model.path,
+                func.count(func.distinct(PositionModel.id)).label('positions_count'),
+                func.count(PositionAssignmentModel.id).label('headcount'),
+            )
+            .outerjoin(PositionModel, PositionModel.subdivision_id == self.model.id)
+            .outerjoin(PositionAssignmentModel, PositionAssignmentModel.position_id == PositionModel.id)
+            .where(self.model.company_id == company_id)
+            .group_by(self.model.id)
+            .order_by(self.model.path)
+        )
+        res: Result = await self.session.execute(query)
+        return res.all()
+
+    async def stream_subtree(
+        self, company_id: UUID4, root_path: Ltree | None = None, max_level: int | None = None,
+    ) -> AsyncIterator[Row]:
+        """Stream subdivisions of company under ``root_path`` ordered by path, parents before children."""
+        query = (
+            select(self.model.id, self.model.name, self.model.path, self.model.manager_id)
+            .where(self.model.company_id == company_id)
+            .order_by(self.model.path)
+            .execution_options(yield_per=self.stream_batch_size)
+        )
+        if root_path is not None:
+            query = query.where(self.model.path.descendant_of(root_path))
+        if max_level is not None:
+            query = query.where(func.nlevel(self.model.path) <= max_level)
+        result = await self.session.stream(query)
+        async for row in result:
+            yield row
+
+    async def copy_subdivisions(self, company_id: UUID4, records: Sequence[tuple[str, str]]) -> set[str]:
+        """Bulk load ``(name, path)`` records through COPY into a staging table and insert them at once.
+
+        Returns names of inserted subdivisions, rows that hit the unique name constraint are skipped.
+        """
+        await self.session.execute(
+            text(
+                'CREATE TEMP TABLE subdivision_import (name varchar(100) NOT NULL, path text NOT NULL) '
+                'ON COMMIT DROP',
+            ),
+        )
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            'subdivision_import', records=records, columns=('name', 'path'),
+        )
+        stmt = text(
+            'INSERT INTO subdivision (name, path, company_id) '
+            'SELECT name, CAST(path AS ltree), :company_id FROM subdivision_import '
+            'ON CONFLICT ON CONSTRAINT unique_subdivision_name DO NOTHING '
+            'RETURNING name',
+        ).params(company_id=company_id)
+        result: Result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def rewrite_subtree_path(self, company_id: UUID4, old_path: Ltree, new_path: Ltree) -> None:
+        """Replace the ``old_path`` prefix of a node and all its descendants with ``new_path``."""
+        stmt = text(
+            'UPDATE subdivision '
+            'SET path = CASE WHEN path = CAST(:old_path AS ltree) THEN CAST(:new_path AS ltree) '
+            'ELSE CAST(:new_path AS ltree) || subpath(path, nlevel(CAST(:old_path AS ltree))) END, '
+            "updated_at = TIMEZONE('utc', now()) "
+            'WHERE company_id = :company_id AND path <@ CAST(:old_path AS ltree)',
+        ).params(company_id=company_id, old_path=str(old_path), new_path=str(new_path))
+        await self.session.execute(stmt)
+
+    async def lift_subtree_children(self, company_id: UUID4, path: Ltree) -> None:
+        """Move all descendants of the node at ``path`` one level up, under the node's parent."""
+        stmt = text(
+            'UPDATE subdivision '
+            'SET path = CASE WHEN nlevel(CAST(:path AS ltree)) > 1 '
+            'THEN subpath(CAST(:path AS ltree), 0, -1) || subpath(path, nlevel(CAST(:path AS ltree))) '
+            'ELSE subpath(path, 1) END, '
+            "updated_at = TIMEZONE('utc', now()) "
+            'WHERE company_id = :company_id AND path <@ CAST(:path AS ltree) '
+            'AND path <> CAST(:path AS ltree)',
+        ).params(company_id=company_id, path=str(path))
+        await self.session.execute(stmt)
+
+    async def delete_subtree(self, company_id: UUID4, path: Ltree) -> None:
+        """Delete the node at ``path`` together with all its descendants."""
+        stmt = text(
+            'DELETE FROM subdivision WHERE company_id = :company_id AND path <@ CAST(:path AS ltree)',
+        ).params(company_id=company_id, path=str(path))
+        await self.session.execute(stmt)
@@ -0,0 +1,93 @@
+from collections.abc import Sequence
+
+from pydantic import UUID4
+from sqlalchemy import Result, Row, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy_utils import Ltree
+
+from src.models import SubdivisionModel
+from src.models.subdivision_stats import SubdivisionStatsModel
+from src.utils.repository import SqlAlchemyRepository
+
+
+class SubdivisionStatsRepository(SqlAlchemyRepository):
+    """Incrementally maintained per-subdivision counters of positions and filled assignments."""
+
+    model = SubdivisionStatsModel
+
+    async def increment(
+        self, subdivision_id: int, positions_delta: int = 0, headcount_delta: int = 0,
+    ) -> None:
+        query = insert(self.model).values(
+            subdivision_id=subdivision_id,
+            positions_count=positions_delta,
+            headcount=headcount_delta,
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[self.model.subdivision_id],
+            set_={
+                'positions_count': self.model.positions_count + query.excluded.positions_count,
+                'headcount': self.model.headcount + query.excluded.headcount,
+                'updated_at': func.timezone('utc', func.now()),
+            },
+        )
+        await self.session.execute(query)
+
+    async def decrement_for_position(self, position_id: int) -> None:
+        """Subtract the position and its assignments, call before the position is deleted."""
+        stmt = text(
+            'UPDATE subdivision_stats AS st '
+            'SET positions_count = st.positions_count - 1, '
+            'headcount = st.headcount - (SELECT count(*) FROM position_assignment WHERE position_id = p.id), '
+            "updated_at = TIMEZONE('utc', now()) "
+            'FROM position AS p '
+            'WHERE p.id = :position_id AND st.subdivision_id = p.subdivision_id',
+        ).params(position_id=position_id)
+        await self.session.execute(stmt)
+
+    async def decrement_for_user(self, user_id: UUID4) -> None:
+        """Subtract all assignments of the user, call before the user is deleted."""
+        stmt = text(
+            'UPDATE subdivision_stats AS st '
+            'SET headcount = st.headcount - assigned.cnt, '
+            "updated_at = TIMEZONE('utc', now()) "
+            'FROM (SELECT p.subdivision_id, count(*) AS cnt '
+            'FROM position_assignment AS pa JOIN position AS p ON p.id = pa.position_id '
+            'WHERE pa.user_id = :user_id GROUP BY p.subdivision_id) AS assigned '
+            'WHERE st.subdivision_id = assigned.subdivision_id',
+        ).params(user_id=user_id)
+        await self.session.execute(stmt)
+
+    async def get_subtree_totals(self, company_id: UUID4, path: Ltree) -> Row:
+        """Sum counters of the subtree, returns ``(subdivisions_count, positions_count, headcount)``."""
+        subdivision = SubdivisionModel
+        query = (
+            select(
+                func.count(subdivision.id).label('subdivisions_count'),
+                func.coalesce(func.sum(self.model.positions_count), 0).label('positions_count'),
+                func.coalesce(func.sum(self.model.headcount), 0).label('headcount'),
+            )
+            .select_from(subdivision)
+            .outerjoin(self.model, self.model.subdivision_id == subdivision.id)
+            .where(subdivision.company_id == company_id, subdivision.path.descendant_of(path))
+        )
+        res: Result = await self.session.execute(query)
+        return res.one()
+
+    async def get_company_counts(self, company_id: UUID4) -> Sequence[Row]:
+        """Get ``(id, name, path, positions_count, headcount)`` of every subdivision ordered by path."""
+        subdivision = SubdivisionModel
+        query = (
+            select(
+                subdivision.id,
+                subdivision.name,
+                subdivision.path,
+                func.coalesce(self.model.positions_count, 0).label('positions_count'),
+                func.coalesce(self.model.headcount, 0).label('headcount'),
+            )
+            .outerjoin(self.model, self.model.subdivision_id == subdivision.id)
+            .where(subdivision.company_id == company_id)
+            .order_by(subdivision.path)
+        )
+        res: Result = await self.session.execute(query)
+        return res.all()
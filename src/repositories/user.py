@@ -1,18 +1,50 @@
 from collections.abc import Sequence
 
-from sqlalchemy import Result, select
+from pydantic import UUID4
+from sqlalchemy import Result, String, any_, bindparam, func, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 
 from src.models import UserModel
 from src.schemas.user import UserFilters
+from src.utils.pagination import Page
 from src.utils.repository import SqlAlchemyRepository
 
+TRIGRAM_MIN_LENGTH = 3
+
+
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
 
 class UserRepository(SqlAlchemyRepository):
     model = UserModel
+    search_columns = ('username', 'first_name', 'last_name', 'middle_name', 'email')
+
+    async def get_existing_ids(self, user_ids: Sequence[UUID4], company_id: UUID4) -> set[UUID4]:
+        """Get ids of the given users that exist in company."""
+        user_ids_param = bindparam('user_ids', value=list(user_ids), type_=ARRAY(UUID(as_uuid=True)))
+        query = select(self.model.id).where(
+            self.model.id == any_(user_ids_param),
+            self.model.company_id == company_id,
+        )
+        res: Result = await self.session.execute(query)
+        return set(res.scalars().all())
+
+    async def get_by_emails(self, emails: Sequence[str]) -> Sequence[UserModel]:
+        """Find users by lowercase emails with one lookup on the lower(email) index."""
+        emails_param = bindparam('emails', value=list(emails), type_=ARRAY(String()))
+        query = select(self.model).where(func.lower(self.model.email) == any_(emails_param))
+        res: Result = await self.session.execute(query)
+        return res.scalars().all()
+
+    async def get_users_by_filter(self, filters: UserFilters, company_id: UUID4) -> Page[UserModel]:
+        """Get page of company users by filters ordered by (last_name, first_name, id).
 
-    async def get_users_by_filter(self, filters: UserFilters) -> Sequence[UserModel]:
-        """Find all users by filters."""
-        query = select(self.model)
+        With ``filters.like`` users matching it as a substring or fuzzily are ranked by similarity first.
+        A ``like`` shorter than a trigram has no trigrams to match or rank by, it is a substring filter
+        on the keyset order then.
+        """
+        query = select(self.model).where(self.model.company_id == company_id)
 
         if filters.ids:
             query = query.where(self.model.id.in_(filters.ids))
@@ -26,5 +58,16 @@ class UserRepository(SqlAlchemyRepository):
         if filters.middle_name:
             query = query.where(self.model.middle_name.in_(filters.middle_name))
 
-        res: Result = await self.session.execute(query)
-        return res.scalars().all()
+        rank = None
+        if filters.like:
+            columns = [getattr(self.model, name) for name in self.search_columns]
+            pattern = f'%{_escape_like(filters.like)}%'
+            matches = [column.ilike(pattern, escape='\\') for column in columns]
+            if len(filters.like) >= TRIGRAM_MIN_LENGTH:
+                matches.extend(column.op('%', is_comparison=True)(filters.like) for column in columns)
+                rank = func.greatest(*(func.similarity(column, filters.like) for column in columns))
+            query = query.where(or_(*matches))
+
+        return await self.get_page(
+            filters, query, sort_columns=(self.model.last_name, self.model.first_name), ranked_by=rank,
+        )
@@ -1,6 +1,67 @@
-from src.models import PositionAssignmentModel
+from collections.abc import Sequence
+
+from pydantic import UUID4
+from sqlalchemy import Result, Row, any_, bindparam, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
+
+from src.models import PositionAssignmentModel, UserModel
 from src.utils.repository import SqlAlchemyRepository
 
 
 class PositionAssignmentRepository(SqlAlchemyRepository):
     model = PositionAssignmentModel
+
+    async def add_users_ignore_assigned(
+        self, position_id: int, user_ids: Sequence[UUID4],
+    ) -> Sequence[PositionAssignmentModel]:
+        """Assign users to position with one statement, skipping users already holding it."""
+        user_ids_param = bindparam('user_ids', value=list(user_ids), type_=ARRAY(UUID(as_uuid=True)))
+        query = (
+            insert(self.model)
+            .from_select(
+                ['user_id', 'position_id'],
+                select(func.unnest(user_ids_param), literal(position_id)),
+            )
+            .on_conflict_do_nothing(constraint='uq_user_position')
+            .returning(self.model)
+        )
+        res: Result = await self.session.execute(query)
+        return res.scalars().all()
+
+    async def remove_users_except(self, position_id: int, user_ids: Sequence[UUID4]) -> list[UUID4]:
+        """Remove every assignment of position whose user is not in ``user_ids``."""
+        stmt = (
+            delete(self.model)
+            .where(self.model.position_id == position_id, ~self.model.user_id.in_(list(user_ids)))
+            .returning(self.model.user_id)
+        )
+        res: Result = await self.session.execute(stmt)
+        return list(res.scalars().all())
+
+    async def add_company_users(
+        self, position_id: int, user_ids: Sequence[UUID4], company_id: UUID4,
+    ) -> Sequence[Row]:
+        """Assign users of company to position in one statement.
+
+        Returns ``(user_id, added)`` for every given user found in company,
+        ``added`` is false for users that already hold the position.
+        """
+        user_ids_param = bindparam('user_ids', value=list(user_ids), type_=ARRAY(UUID(as_uuid=True)))
+        desired = (
+            select(UserModel.id)
+            .where(UserModel.id == any_(user_ids_param), UserModel.company_id == company_id)
+            .cte('desired')
+        )
+        inserted = (
+            insert(self.model)
+            .from_select(['user_id', 'position_id'], select(desired.c.id, literal(position_id)))
+            .on_conflict_do_nothing(constraint='uq_user_position')
+            .returning(self.model.user_id)
+            .cte('inserted')
+        )
+        stmt = select(
+            desired.c.id.label('user_id'),
+            inserted.c.user_id.is_not(None).label('added'),
+        ).outerjoin_from(desired, inserted, inserted.c.user_id == desired.c.id)
+        res: Result = await self.session.execute(stmt)
+        return res.all()
@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import Annotated
 
 from annotated_types import MaxLen, MinLen
@@ -5,7 +6,7 @@ from pydantic import UUID4, BaseModel, EmailStr, Field
 
 from schemas.user import UserRole
 from schemas.validators_mixins import EmailValidatorMixin
-from src.schemas.response import BaseResponse
+from src.schemas.response import BaseCreateResponse, BaseResponse
 
 
 class CheckAccountResponse(BaseResponse):
@@ -35,3 +36,39 @@ class SignUpCompleteRequest(BaseModel):
     last_name: str = Field(max_length=50)
     middle_name: str | None = Field(max_length=50, default=None)
     company_name: str = Field(max_length=50)
+
+
+class InviteStatus(Enum):
+    QUEUED = 'queued'
+    SENT = 'sent'
+    FAILED = 'failed'
+    NOT_IN_COMPANY = 'not_in_company'
+    ALREADY_ACTIVE = 'already_active'
+
+
+class BulkInviteItem(BaseModel, EmailValidatorMixin):
+    email: EmailStr
+    role: UserRole = UserRole.EMPLOYEE
+
+
+class BulkInviteRequest(BaseModel):
+    invites: list[BulkInviteItem] = Field(..., min_length=1, max_length=5000)
+
+
+class InviteRecipientStatus(BaseModel):
+    email: str
+    status: InviteStatus
+
+
+class InviteJobStatus(BaseModel):
+    job_id: UUID4
+    company_id: UUID4
+    recipients: list[InviteRecipientStatus]
+
+
+class InviteJobCreateResponse(BaseCreateResponse):
+    payload: InviteJobStatus
+
+
+class InviteJobResponse(BaseResponse):
+    payload: InviteJobStatus
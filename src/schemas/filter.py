@@ -7,16 +7,21 @@ from fastapi import Query
 class BaseFilter:
     page: int | None = Query(default=None)
     per_page: int = Query(ge=1, le=100, default=100)
+    cursor: str | None = Query(default=None)
+    with_total: bool = Query(default=False)
 
     @property
     def offset(self) -> int:
-        return self.page * self.per_page if self.page else 0
+        return self.page * self.per_page if self.page and not self.cursor else 0
 
     @property
-    def limit(self) -> int | None:
-        return self.per_page if self.page is not None else None
+    def limit(self) -> int:
+        return self.per_page
 
 
 @dataclass
 class TypeFilter(BaseFilter):
-    like: str = Query(default='')
+    like: str = Query(default='', max_length=100)
+
+    def __post_init__(self) -> None:
+        self.like = self.like.strip()
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class OutboxStatus(Enum):
+    PENDING = 'pending'
+    SENT = 'sent'
+    FAILED = 'failed'
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Annotated
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +14,11 @@ class PositionCreateRequest(PositionBase):
     subdivision_id: int
 
 
+class PositionBulkCreateRequest(BaseModel):
+    subdivision_id: int
+    titles: list[Annotated[str, Field(max_length=100)]] = Field(..., min_length=1, max_length=1000)
+
+
 class PositionUpdateRequest(PositionBase):
     pass
 
@@ -37,3 +43,22 @@ class PositionListResponse(BaseResponse):
 
 class PositionCreateResponse(BaseCreateResponse):
     payload: PositionInDB
+
+
+class PositionBulkCreateResult(BaseModel):
+    created: list[PositionInDB]
+    duplicates: list[str]
+
+
+class PositionBulkCreateResponse(BaseCreateResponse):
+    payload: PositionBulkCreateResult
+
+
+class PositionPage(BaseModel):
+    items: list[PositionInDB]
+    next_cursor: str | None = None
+    total_estimate: int | None = None
+
+
+class PositionPageResponse(BaseResponse):
+    payload: PositionPage
@@ -42,6 +42,10 @@ class SubdivisionUpdateByNameRequest(SubdivisionBase):
     pass
 
 
+class SubdivisionMoveRequest(BaseModel):
+    parent_id: int | None = None
+
+
 class SubdivisionInDB(SubdivisionBase):
     id: int
     path: LtreeField
@@ -64,3 +68,78 @@ class SubdivisionListResponse(BaseResponse):
 
 class SubdivisionCreateResponse(BaseCreateResponse):
     payload: SubdivisionInDB
+
+
+class SubdivisionShort(SubdivisionBase):
+    id: int
+    path: LtreeField
+    manager_id: UUID4 | None
+
+
+class SubdivisionShortListResponse(BaseResponse):
+    payload: list[SubdivisionShort]
+
+
+class SubdivisionAncestorsRequest(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=1000)
+
+
+class SubdivisionAncestors(BaseModel):
+    subdivision_id: int
+    ancestors: list[SubdivisionShort] = Field(default_factory=list)
+
+
+class SubdivisionAncestorsListResponse(BaseResponse):
+    payload: list[SubdivisionAncestors]
+
+
+class SubdivisionStats(BaseModel):
+    subdivisions_count: int
+    positions_count: int
+    headcount: int
+
+
+class SubdivisionStatsDB(BaseModel):
+    subdivision_id: int
+    positions_count: int
+    headcount: int
+
+    class Config:
+        from_attributes = True
+
+
+class SubdivisionStatsResponse(BaseResponse):
+    payload: SubdivisionStats
+
+
+class SubdivisionNodeStats(SubdivisionStats):
+    id: int
+    name: str
+    path: LtreeField
+
+
+class SubdivisionNodeStatsListResponse(BaseResponse):
+    payload: list[SubdivisionNodeStats]
+
+
+class SubdivisionTreeNode(SubdivisionShort):
+    children: list['SubdivisionTreeNode'] = Field(default_factory=list)
+
+
+class SubdivisionTreeResponse(BaseResponse):
+    payload: list[SubdivisionTreeNode]
+
+
+class SubdivisionImportRowError(BaseModel):
+    row: int
+    name: str
+    detail: str
+
+
+class SubdivisionImportResult(BaseModel):
+    created: int
+    errors: list[SubdivisionImportRowError] = Field(default_factory=list)
+
+
+class SubdivisionImportResponse(BaseCreateResponse):
+    payload: SubdivisionImportResult
@@ -73,6 +73,11 @@ class UsersListResponse(BaseResponse):
     payload: list[UserDB]
 
 
+class UsersPageResponse(UsersListResponse):
+    next_cursor: str | None = None
+    total_estimate: int | None = None
+
+
 @dataclass
 class UserFilters(TypeFilter):
     ids: list[UUID4] | None = Query(None)
@@ -1,4 +1,4 @@
-from pydantic import UUID4, BaseModel
+from pydantic import UUID4, BaseModel, Field
 
 from src.schemas.response import BaseCreateResponse, BaseResponse
 
@@ -21,6 +21,27 @@ class PositionAssignmentDB(PositionAssignmentId):
     position_id: int
 
 
+class PositionAssignmentBulkResult(BaseModel):
+    assigned: list[PositionAssignmentDB] = Field(default_factory=list)
+    already_assigned: list[UUID4] = Field(default_factory=list)
+    not_found: list[UUID4] = Field(default_factory=list)
+
+
+class PositionAssignmentSyncRequest(BaseModel):
+    user_ids: list[UUID4]
+
+
+class PositionAssignmentSyncResult(BaseModel):
+    added: list[UUID4] = Field(default_factory=list)
+    removed: list[UUID4] = Field(default_factory=list)
+    unchanged: list[UUID4] = Field(default_factory=list)
+    not_found: list[UUID4] = Field(default_factory=list)
+
+
+class PositionAssignmentSyncResponse(BaseResponse):
+    payload: PositionAssignmentSyncResult
+
+
 class PositionAssignmentResponse(BaseResponse):
     payload: PositionAssignmentDB
 
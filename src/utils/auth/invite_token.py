@@ -1,7 +1,7 @@
-import smtplib
+from collections.abc import Sequence
 from datetime import timedelta
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
+from typing import Any
 
 import jwt
 from loguru import logger
@@ -11,6 +11,8 @@ from src.config import settings
 from src.schemas.user import UserRole
 from src.utils.auth.jwt_tools import create_jwt, decode_jwt
 
+INVITATION_EMAIL_TOPIC = 'invitation_email'
+
 
 def generate_admin_invite_token(account: str, role: UserRole) -> str:
     token_data = {
@@ -53,11 +55,28 @@ def verify_invite_token(token: str) -> dict | None:
         return None
 
 
-async def send_invitation_email(account: str, invite_token: str) -> None:
-    smtp_settings = settings.email
+def generate_employee_invite_tokens(
+    company_id: UUID4, invites: Sequence[tuple[str, UserRole]],
+) -> list[str]:
+    """Sign invite tokens of many accounts, meant to run on a worker thread."""
+    return [generate_employee_invite_token(company_id, account, role) for account, role in invites]
+
+
+def invitation_outbox_message(
+    account: str, invite_token: str, job_id: UUID4 | None = None, company_id: UUID4 | None = None,
+) -> dict[str, Any]:
+    """Get outbox row of invitation email, delivered once the transaction writing it commits."""
+    return {
+        'topic': INVITATION_EMAIL_TOPIC,
+        'recipient': account,
+        'payload': {'invite_token': invite_token, 'company_id': str(company_id) if company_id else None},
+        'job_id': job_id,
+    }
 
-    msg = MIMEMultipart()
-    msg['From'] = smtp_settings.from_email
+
+def build_invitation_email(account: str, invite_token: str) -> EmailMessage:
+    msg = EmailMessage()
+    msg['From'] = settings.email.from_email
     msg['To'] = account
     msg['Subject'] = 'Приглашение для регистрации'
 
@@ -73,15 +92,5 @@ async def send_invitation_email(account: str, invite_token: str) -> None:
 
     Спасибо.
     """
-    msg.attach(MIMEText(body, 'plain'))
-
-    try:
-        server = smtplib.SMTP(smtp_settings.smtp_server, smtp_settings.smtp_port)
-        server.starttls()
-        server.login(smtp_settings.smtp_username, smtp_settings.smtp_password)
-        text = msg.as_string()
-        server.sendmail(smtp_settings.from_email, account, text)
-        server.quit()
-        logger.info(f'Письмо успешно отправлено на {account}')
-    except Exception as e:
-        logger.info(f'Ошибка при отправке письма: {e}')
+    msg.set_content(body)
+    return msg
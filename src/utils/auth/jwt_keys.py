@@ -0,0 +1,142 @@
+"""The module contains JWT signing and verification keys parsed once and identified by ``kid``."""
+
+import base64
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes, PublicKeyTypes
+from jwt import InvalidTokenError
+from loguru import logger
+
+from src.config import settings
+
+SUPPORTED_ALGORITHMS = ('RS256', 'ES256', 'EdDSA')
+FORCED_RELOAD_INTERVAL = 1.0
+
+
+def key_algorithm(key: PublicKeyTypes) -> str:
+    """Get JWT algorithm of public key, so a key is never used with an algorithm of another key type."""
+    if isinstance(key, rsa.RSAPublicKey):
+        return 'RS256'
+    if isinstance(key, ec.EllipticCurvePublicKey) and isinstance(key.curve, ec.SECP256R1):
+        return 'ES256'
+    if isinstance(key, ed25519.Ed25519PublicKey | ed448.Ed448PublicKey):
+        return 'EdDSA'
+    msg = f'Unsupported JWT key type {type(key).__name__}'
+    raise ValueError(msg)
+
+
+def key_id(key: PublicKeyTypes) -> str:
+    """Get stable ``kid`` of public key: truncated SHA-256 of its SubjectPublicKeyInfo."""
+    der = key.public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+    return base64.urlsafe_b64encode(hashlib.sha256(der).digest()[:12]).decode()
+
+
+class JWTKeySet:
+    """Signing key and verification keys by ``kid``, reloaded from disk when keys rotate.
+
+    The signing key is ``private_key_path`` and must match ``algorithm``. Verification keys are its
+    public key, ``public_key_path`` and every ``*.pem`` public key in ``public_keys_dir``, so tokens
+    signed with a previous key stay valid until they expire. Files are re-read at most every
+    ``reload_interval`` seconds, or at once when a token names an unknown ``kid``.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        private_key_path: Path,
+        public_key_path: Path,
+        public_keys_dir: Path,
+        reload_interval: float,
+    ) -> None:
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            msg = f'Unsupported JWT algorithm {algorithm!r}, expected one of {SUPPORTED_ALGORITHMS}'
+            raise ValueError(msg)
+        self.algorithm = algorithm
+        self.private_key_path = private_key_path
+        self.public_key_path = public_key_path
+        self.public_keys_dir = public_keys_dir
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._fingerprint: tuple[tuple[str, float], ...] = ()
+        self.signing_kid = ''
+        self.signing_key: PrivateKeyTypes | None = None
+        self._public_keys: dict[str, PublicKeyTypes] = {}
+
+    def _key_files(self) -> list[Path]:
+        files = [self.private_key_path]
+        if self.public_key_path.is_file():
+            files.append(self.public_key_path)
+        if self.public_keys_dir.is_dir():
+            files.extend(sorted(self.public_keys_dir.glob('*.pem')))
+        return files
+
+    def _load(self, files: list[Path]) -> tuple[str, PrivateKeyTypes, dict[str, PublicKeyTypes]]:
+        """Parse ``(signing kid, signing key, verification keys by kid)`` from key files."""
+        signing_key = serialization.load_pem_private_key(self.private_key_path.read_bytes(), password=None)
+        public_keys = {}
+        for path in files[1:]:
+            public_key = serialization.load_pem_public_key(path.read_bytes())
+            public_keys[key_id(public_key)] = public_key
+        signing_public_key = signing_key.public_key()
+        if key_algorithm(signing_public_key) != self.algorithm:
+            msg = f'JWT signing key {self.private_key_path} does not match algorithm {self.algorithm}'
+            raise ValueError(msg)
+        signing_kid = key_id(signing_public_key)
+        public_keys[signing_kid] = signing_public_key
+        return signing_kid, signing_key, public_keys
+
+    def _reload(self, *, force: bool = False) -> None:
+        """Re-read keys when files changed, a broken rotation keeps the keys loaded before it."""
+        with self._lock:
+            now = time.monotonic()
+            interval = FORCED_RELOAD_INTERVAL if force else self.reload_interval
+            if self.signing_key is not None and now - self._checked_at < interval:
+                return
+            self._checked_at = now
+            try:
+                files = self._key_files()
+                fingerprint = tuple((str(path), path.stat().st_mtime) for path in files)
+                if fingerprint == self._fingerprint:
+                    return
+                signing_kid, signing_key, public_keys = self._load(files)
+            except Exception:
+                if self.signing_key is None:
+                    raise
+                logger.exception(f'Failed to reload JWT keys, keeping signing key {self.signing_kid}')
+                return
+            self.signing_kid = signing_kid
+            self.signing_key = signing_key
+            self._public_keys = public_keys
+            self._fingerprint = fingerprint
+            logger.info(f'Loaded JWT signing key {self.signing_kid} and {len(public_keys)} verification keys')
+
+    def get_signing_key(self) -> tuple[str, PrivateKeyTypes, str]:
+        """Get ``(kid, key, algorithm)`` to sign new tokens with."""
+        self._reload()
+        return self.signing_kid, self.signing_key, self.algorithm
+
+    def get_verification_key(self, kid: str | None) -> tuple[PublicKeyTypes, str]:
+        """Get ``(key, algorithm)`` for token ``kid``, tokens without ``kid`` use the signing key."""
+        self._reload()
+        kid = kid or self.signing_kid
+        if kid not in self._public_keys:
+            self._reload(force=True)
+        if (public_key := self._public_keys.get(kid)) is None:
+            msg = f'Unknown signing key {kid!r}'
+            raise InvalidTokenError(msg)
+        return public_key, key_algorithm(public_key)
+
+
+jwt_key_set = JWTKeySet(
+    algorithm=settings.auth_jwt.algorithm,
+    private_key_path=settings.auth_jwt.private_key_path,
+    public_key_path=settings.auth_jwt.public_key_path,
+    public_keys_dir=settings.auth_jwt.public_keys_dir,
+    reload_interval=settings.auth_jwt.key_reload_interval_seconds,
+)
@@ -5,10 +5,12 @@ import jwt
 
 from schemas.user import UserSchema
 from src.config import settings
+from src.utils.auth.jwt_keys import jwt_key_set
 
 TOKEN_TYPE_FIELD = 'type'
 ACCESS_TOKEN_TYPE = 'access'
 REFRESH_TOKEN_TYPE = 'refresh'
+USER_CLAIMS = ('role', 'company_id', 'active', 'first_name', 'last_name', 'middle_name')
 
 
 def create_jwt(
@@ -32,6 +34,15 @@ def create_access_token(user: UserSchema) -> str:
         'id': str(user.id),
         'email': user.email,
     }
+    if settings.auth_jwt.stateless_access_tokens:
+        jwt_payload.update(
+            role=user.role.value if user.role else None,
+            company_id=str(user.company_id) if user.company_id else None,
+            active=user.active,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            middle_name=user.middle_name,
+        )
     return create_jwt(
         token_type=ACCESS_TOKEN_TYPE,
         token_data=jwt_payload,
@@ -53,8 +64,6 @@ def create_refresh_token(user: UserSchema) -> str:
 
 def encode_jwt(
     payload: dict,
-    private_key: str = settings.auth_jwt.private_key_path.read_text(),
-    algorithm: str = settings.auth_jwt.algorithm,
     expire_minutes: int = settings.auth_jwt.access_token_expire_minutes,
     expire_timedelta: timedelta | None = None,
 ) -> str:
@@ -65,19 +74,21 @@ def encode_jwt(
         exp=expire,
         iat=now,
     )
+    kid, private_key, algorithm = jwt_key_set.get_signing_key()
     encoded = jwt.encode(
         to_encode,
         private_key,
         algorithm=algorithm,
+        headers={'kid': kid},
     )
     return encoded
 
 
 def decode_jwt(
     token: str | bytes,
-    public_key: str = settings.auth_jwt.public_key_path.read_text(),
-    algorithm: str = settings.auth_jwt.algorithm,
 ) -> dict:
+    kid = jwt.get_unverified_header(token).get('kid')
+    public_key, algorithm = jwt_key_set.get_verification_key(kid)
     decoded = jwt.decode(
         token,
         public_key,
@@ -89,6 +100,6 @@ def decode_jwt(
 def hash_password(
     password: str,
 ) -> bytes:
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.password_hashing.rounds)
     pwd_bytes: bytes = password.encode()
     return bcrypt.hashpw(pwd_bytes, salt)
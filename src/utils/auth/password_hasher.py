@@ -0,0 +1,93 @@
+"""The module contains bcrypt hashing and verification run off the event loop."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+import bcrypt
+from fastapi import HTTPException
+from starlette import status
+
+from src.config import settings
+from src.utils.metrics import metrics
+
+T = TypeVar('T')
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded thread pool, bcrypt releases the GIL while hashing.
+
+    At most ``max_pending`` operations are queued or running, callers beyond that wait for a slot
+    for up to ``queue_timeout`` seconds and then get 503 instead of piling up on the worker.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, queue_timeout: float, rounds: int) -> None:
+        self.rounds = rounds
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hasher')
+        self._slots = asyncio.Semaphore(max_pending)
+        self._pending = 0
+
+    async def _run(self, operation: str, func: Callable[..., T], *args: object) -> T:
+        self._set_pending(1)
+        started_at = time.perf_counter()
+        try:
+            await self._acquire_slot(operation)
+            try:
+                queued_at = time.perf_counter()
+                metrics.observe('password_hasher_wait_seconds', queued_at - started_at, operation=operation)
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._executor, func, *args)
+                elapsed = time.perf_counter() - queued_at
+                metrics.observe('password_hasher_seconds', elapsed, operation=operation)
+            finally:
+                self._slots.release()
+        finally:
+            self._set_pending(-1)
+        return result
+
+    async def _acquire_slot(self, operation: str) -> None:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except TimeoutError:
+            metrics.inc('password_hasher_rejected_total', operation=operation)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail='Too many authentication requests, try again later',
+            ) from None
+
+    def _set_pending(self, delta: int) -> None:
+        self._pending += delta
+        metrics.set_gauge('password_hasher_pending', self._pending)
+
+    async def hash(self, password: str) -> bytes:
+        return await self._run('hash', self._hash, password.encode())
+
+    async def verify(self, password: str, hashed_password: bytes) -> bool:
+        return await self._run('verify', bcrypt.checkpw, password.encode(), hashed_password)
+
+    def _hash(self, password: bytes) -> bytes:
+        return bcrypt.hashpw(password, bcrypt.gensalt(rounds=self.rounds))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hashing.max_workers,
+    max_pending=settings.password_hashing.max_pending,
+    queue_timeout=settings.password_hashing.queue_timeout_seconds,
+    rounds=settings.password_hashing.rounds,
+)
+
+
+async def hash_password_async(password: str) -> bytes:
+    """Hash password on the hashing pool."""
+    return await password_hasher.hash(password)
+
+
+async def validate_password_async(password: str, hashed_password: bytes) -> bool:
+    """Check password against bcrypt hash on the hashing pool."""
+    return await password_hasher.verify(password, hashed_password)
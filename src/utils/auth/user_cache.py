@@ -0,0 +1,92 @@
+"""The module contains the in-process cache of users resolved from access tokens."""
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+from itertools import count
+
+from pydantic import UUID4
+
+from src.config import settings
+from src.schemas.user import UserDB
+from src.utils.metrics import metrics
+
+
+class CachedUser:
+    __slots__ = ('loaded_at', 'updated_at', 'user')
+
+    def __init__(self, user: UserDB, updated_at: datetime) -> None:
+        self.user = user
+        self.updated_at = updated_at
+        self.loaded_at = time.monotonic()
+
+
+class AuthUserCache:
+    """LRU cache of users keyed by token subject (username), bounded by number of users.
+
+    Entries expire after ``ttl_seconds`` to bound staleness caused by changes handled in other
+    workers. A load started before any invalidation is never stored, and an entry is never
+    replaced by a copy with an older ``updated_at``.
+    """
+
+    def __init__(self, max_users: int, ttl_seconds: float) -> None:
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self._users: OrderedDict[str, CachedUser] = OrderedDict()
+        self._usernames: dict[UUID4, str] = {}
+        self._generation = 0
+        self._counter = count(1)
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, username: str) -> UserDB | None:
+        entry = self._users.get(username)
+        if entry is not None and time.monotonic() - entry.loaded_at > self.ttl_seconds:
+            self._drop(username)
+            entry = None
+        self._record(hit=entry is not None)
+        if entry is None:
+            return None
+        self._users.move_to_end(username)
+        return entry.user
+
+    def generation(self) -> int:
+        """Get the invalidation generation to pass to ``put`` for a user that is about to be loaded."""
+        return self._generation
+
+    def put(self, user: UserDB, updated_at: datetime, generation: int) -> None:
+        """Store the loaded user unless any user was invalidated while it was being loaded."""
+        if generation != self._generation:
+            return
+        current = self._users.get(user.username)
+        if current is not None and current.updated_at > updated_at:
+            return
+        self._users[user.username] = CachedUser(user, updated_at)
+        self._users.move_to_end(user.username)
+        self._usernames[user.id] = user.username
+        while len(self._users) > self.max_users:
+            _, evicted = self._users.popitem(last=False)
+            self._usernames.pop(evicted.user.id, None)
+
+    def invalidate(self, user_id: UUID4) -> None:
+        self._generation = next(self._counter)
+        if (username := self._usernames.get(user_id)) is not None:
+            self._drop(username)
+
+    def _drop(self, username: str) -> None:
+        if (entry := self._users.pop(username, None)) is not None:
+            self._usernames.pop(entry.user.id, None)
+
+    def _record(self, *, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+        metrics.inc('auth_user_cache_requests_total', result='hit' if hit else 'miss')
+        metrics.set_gauge('auth_user_cache_hit_ratio', self._hits / (self._hits + self._misses))
+
+
+auth_user_cache = AuthUserCache(
+    max_users=settings.auth_user_cache.max_users,
+    ttl_seconds=settings.auth_user_cache.ttl_seconds,
+)
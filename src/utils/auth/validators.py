@@ -2,12 +2,21 @@ import bcrypt
 from fastapi import Depends, Form, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jwt import InvalidTokenError
-from pydantic import UUID4
+from pydantic import UUID4, ValidationError
 from starlette import status
 
 from src.api.v1.services.user import UserService
+from src.config import settings
 from src.schemas.user import UserRole, UserSchema
-from src.utils.auth.jwt_tools import ACCESS_TOKEN_TYPE, REFRESH_TOKEN_TYPE, TOKEN_TYPE_FIELD, decode_jwt
+from src.utils.auth.jwt_tools import (
+    ACCESS_TOKEN_TYPE,
+    REFRESH_TOKEN_TYPE,
+    TOKEN_TYPE_FIELD,
+    USER_CLAIMS,
+    decode_jwt,
+)
+from src.utils.auth.password_hasher import validate_password_async
+from src.utils.auth.user_cache import auth_user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl='/api/v1/jwt/login/',
@@ -49,10 +58,18 @@ def validate_token_type(
 async def get_user_by_token_sub(
     payload: dict,
     service: UserService = Depends(get_user_service),
+    *,
+    use_cache: bool = True,
 ) -> UserSchema:
+    """Get user named in the token subject, from the auth user cache unless ``use_cache`` is off."""
     username: str | None = payload.get('sub')
+    if use_cache and username and (user := auth_user_cache.get(username.lower())) is not None:
+        return user
+    generation = auth_user_cache.generation()
     user_model = await service.get_user_by_username(username=username)
-    if user := user_model:
+    if user_model:
+        user = user_model.to_pydantic_schema()
+        auth_user_cache.put(user, updated_at=user_model.updated_at, generation=generation)
         return user
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -60,13 +77,28 @@ async def get_user_by_token_sub(
     )
 
 
+def get_user_from_token_claims(payload: dict) -> UserSchema | None:
+    """Build user from claims of stateless access token, None if the token does not carry them."""
+    if not settings.auth_jwt.stateless_access_tokens or not all(claim in payload for claim in USER_CLAIMS):
+        return None
+    claims = {claim: payload[claim] for claim in USER_CLAIMS}
+    claims.update(id=payload.get('id'), username=payload.get('sub'), email=payload.get('email'))
+    try:
+        return UserSchema.model_validate(claims, strict=False)
+    except ValidationError:
+        return None
+
+
 def get_auth_user_from_token_of_type(token_type: str):
     async def get_auth_user_from_token(
         payload: dict = Depends(get_current_token_payload),
         service: UserService = Depends(get_user_service),
     ) -> UserSchema:
         validate_token_type(payload, token_type)
-        return await get_user_by_token_sub(payload, service)
+        if token_type == ACCESS_TOKEN_TYPE and (user := get_user_from_token_claims(payload)):
+            return user
+        # Refresh re-reads the user, so deactivation or a role change is seen before new tokens are issued.
+        return await get_user_by_token_sub(payload, service, use_cache=token_type != REFRESH_TOKEN_TYPE)
 
     return get_auth_user_from_token
 
@@ -112,7 +144,7 @@ async def validate_auth_user(
     if not (user := await service.get_user_by_username(username)):
         raise unauthed_exc
 
-    if not validate_password(
+    if not await validate_password_async(
         password=password,
         hashed_password=user.hashed_password,
     ):
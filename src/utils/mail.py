@@ -0,0 +1,217 @@
+"""The module contains the in-process email queue delivered over persistent SMTP connections."""
+
+import asyncio
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.message import EmailMessage
+
+import aiosmtplib
+from loguru import logger
+
+from src.config import settings
+from src.utils.metrics import metrics
+
+_jitter = random.SystemRandom()
+
+
+def _smtp_address() -> tuple[str, int] | None:
+    smtp_settings = settings.email
+    try:
+        port = int(smtp_settings.smtp_port)
+    except (TypeError, ValueError):
+        return None
+    if not smtp_settings.smtp_server:
+        return None
+    return smtp_settings.smtp_server, port
+
+
+@dataclass(slots=True)
+class OutgoingMail:
+    message: EmailMessage
+    on_result: Callable[[str | None], None] | None = None
+    max_attempts: int | None = None
+    expires_at: float | None = None
+    attempt: int = 0
+    enqueued_at: float = 0.0
+
+
+def _report(mail: OutgoingMail, error: str | None) -> None:
+    if mail.on_result is None:
+        return
+    try:
+        mail.on_result(error)
+    except Exception:
+        logger.exception('Email result callback failed')
+
+
+class SMTPConnection:
+    """One authenticated SMTP session reused for many messages and re-opened after failures."""
+
+    def __init__(self, hostname: str, port: int) -> None:
+        self.hostname = hostname
+        self.port = port
+        self._client: aiosmtplib.SMTP | None = None
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp_settings = settings.email
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=smtp_settings.smtp_username or None,
+            password=smtp_settings.smtp_password or None,
+            start_tls=smtp_settings.smtp_start_tls,
+            timeout=smtp_settings.smtp_timeout_seconds,
+        )
+        await client.connect()
+        return client
+
+    async def send(self, message: EmailMessage) -> None:
+        if self._client is None or not self._client.is_connected:
+            self._client = await self._connect()
+        try:
+            await self._client.send_message(message)
+        except aiosmtplib.SMTPException:
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        client, self._client = self._client, None
+        if client is not None and client.is_connected:
+            try:
+                await client.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                client.close()
+
+
+class MailQueue:
+    """Queue of outgoing emails drained by workers, each holding its own SMTP connection.
+
+    Failed sends are retried with exponential backoff and jitter up to ``max_attempts`` times,
+    unless a message sets its own limit.
+    A worker survives any error of a single message and always reports its outcome to ``on_result``.
+    """
+
+    def __init__(self, workers: int, max_size: int, max_attempts: int, base_delay: float) -> None:
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.disabled_reason: str | None = None
+        self._queue: asyncio.Queue[OutgoingMail] = asyncio.Queue(maxsize=max_size)
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start workers, without a configured SMTP server the queue stays stopped and fails every message."""
+        address = _smtp_address()
+        if address is None:
+            self.disabled_reason = 'SMTP server is not configured'
+            logger.warning('SMTP_SERVER and a numeric SMTP_PORT are not set, emails will not be sent')
+            return
+        self.disabled_reason = None
+        hostname, port = address
+        self._tasks = [
+            asyncio.create_task(self._work(SMTPConnection(hostname, port)), name=f'mail-worker-{number}')
+            for number in range(self.workers)
+        ]
+
+    async def stop(self, grace_period: float = 10) -> None:
+        """Deliver what is already queued within ``grace_period`` seconds, then stop workers."""
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=grace_period)
+        except TimeoutError:
+            logger.warning(f'Mail queue stopped with {self._queue.qsize()} undelivered messages')
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def enqueue(
+        self,
+        message: EmailMessage,
+        on_result: Callable[[str | None], None] | None = None,
+        *,
+        max_attempts: int | None = None,
+        expires_in: float | None = None,
+    ) -> None:
+        """Queue message, ``on_result`` gets None once it is sent or the last error once delivery failed.
+
+        ``max_attempts`` overrides the queue retry limit for this message, a message still waiting
+        in the queue ``expires_in`` seconds after being queued is dropped and reported as failed.
+        A disabled queue reports the message as failed at once.
+        """
+        now = time.perf_counter()
+        mail = OutgoingMail(
+            message,
+            on_result=on_result,
+            max_attempts=max_attempts,
+            expires_at=None if expires_in is None else now + expires_in,
+            enqueued_at=now,
+        )
+        if self.disabled_reason is not None:
+            metrics.inc('mail_failed_total')
+            _report(mail, self.disabled_reason)
+            return
+        await self._queue.put(mail)
+        metrics.set_gauge('mail_queue_depth', self._queue.qsize())
+
+    async def _work(self, connection: SMTPConnection) -> None:
+        try:
+            while True:
+                mail = await self._queue.get()
+                metrics.set_gauge('mail_queue_depth', self._queue.qsize())
+                error = 'Mail worker stopped'
+                try:
+                    error = await self._deliver(connection, mail)
+                except Exception as e:
+                    metrics.inc('mail_failed_total')
+                    logger.exception(f'Unexpected error sending email to {mail.message["To"]}')
+                    error = str(e) or type(e).__name__
+                    await connection.close()
+                finally:
+                    self._queue.task_done()
+                    _report(mail, error)
+        finally:
+            await connection.close()
+
+    async def _deliver(self, connection: SMTPConnection, mail: OutgoingMail) -> str | None:
+        """Send mail retrying failures, return the last error if it could not be delivered."""
+        recipient = mail.message['To']
+        max_attempts = mail.max_attempts or self.max_attempts
+        while True:
+            if mail.expires_at is not None and time.perf_counter() >= mail.expires_at:
+                metrics.inc('mail_expired_total')
+                logger.warning(f'Email to {recipient} expired after {mail.attempt} attempts')
+                return 'Expired before it could be sent'
+            mail.attempt += 1
+            started_at = time.perf_counter()
+            try:
+                await connection.send(mail.message)
+            except (aiosmtplib.SMTPException, OSError) as e:
+                metrics.inc('mail_send_errors_total')
+                if mail.attempt >= max_attempts:
+                    metrics.inc('mail_failed_total')
+                    logger.error(f'Failed to send email to {recipient} after {mail.attempt} attempts: {e}')
+                    return str(e)
+                delay = self.base_delay * 2 ** (mail.attempt - 1)
+                logger.warning(f'Failed to send email to {recipient}, retrying in {delay:.1f}s: {e}')
+                await asyncio.sleep(delay + _jitter.uniform(0, delay))
+                continue
+            finished_at = time.perf_counter()
+            metrics.observe('mail_send_seconds', finished_at - started_at)
+            metrics.observe('mail_delivery_seconds', finished_at - mail.enqueued_at)
+            metrics.inc('mail_sent_total')
+            logger.info(f'Email sent to {recipient}')
+            return None
+
+
+mail_queue = MailQueue(
+    workers=settings.email.smtp_pool_size,
+    max_size=settings.email.queue_max_size,
+    max_attempts=settings.email.send_attempts,
+    base_delay=settings.email.retry_base_delay_seconds,
+)
@@ -0,0 +1,62 @@
+"""The module contains a minimal in-process metrics registry."""
+
+from collections import defaultdict
+from typing import Any
+
+LabelsKey = tuple[tuple[str, str], ...]
+
+
+class Summary:
+    __slots__ = ('count', 'max', 'total')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+
+class Metrics:
+    """Counters, gauges and summaries keyed by metric name and labels, kept per process."""
+
+    def __init__(self) -> None:
+        self._counters: defaultdict[str, defaultdict[LabelsKey, float]] = defaultdict(
+            lambda: defaultdict(float),
+        )
+        self._gauges: defaultdict[str, dict[LabelsKey, float]] = defaultdict(dict)
+        self._summaries: defaultdict[str, defaultdict[LabelsKey, Summary]] = defaultdict(
+            lambda: defaultdict(Summary),
+        )
+
+    @staticmethod
+    def _labels_key(labels: dict[str, Any]) -> LabelsKey:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        self._counters[name][self._labels_key(labels)] += value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        self._gauges[name][self._labels_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        self._summaries[name][self._labels_key(labels)].observe(value)
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        snapshot: dict[str, list[dict[str, Any]]] = {}
+        for name, series in self._counters.items():
+            snapshot[name] = [{'labels': dict(key), 'value': value} for key, value in series.items()]
+        for name, series in self._gauges.items():
+            snapshot[name] = [{'labels': dict(key), 'value': value} for key, value in series.items()]
+        for name, series in self._summaries.items():
+            snapshot[name] = [
+                {'labels': dict(key), 'count': summary.count, 'sum': summary.total, 'max': summary.max}
+                for key, summary in series.items()
+            ]
+        return snapshot
+
+
+metrics = Metrics()
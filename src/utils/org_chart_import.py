@@ -0,0 +1,123 @@
+"""The module contains parsing and planning of bulk subdivision (org chart) imports."""
+
+import csv
+import io
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from itertools import starmap
+
+import orjson
+from sqlalchemy_utils import Ltree
+
+NAME_MAX_LENGTH = 100
+
+
+@dataclass(slots=True)
+class OrgChartRow:
+    row: int
+    name: str
+    parent: str
+
+
+@dataclass(slots=True)
+class OrgChartRowError:
+    row: int
+    name: str
+    detail: str
+
+
+@dataclass(slots=True)
+class OrgChartImportPlan:
+    records: list[tuple[str, str]] = field(default_factory=list)
+    rows_by_name: dict[str, int] = field(default_factory=dict)
+    errors: list[OrgChartRowError] = field(default_factory=list)
+
+
+def parse_org_chart_csv(content: str) -> list[OrgChartRow]:
+    """Parse CSV with ``name`` and ``parent`` columns, an empty parent marks a top-level subdivision."""
+    reader = csv.DictReader(io.StringIO(content))
+    return list(starmap(_make_row, enumerate(reader, start=1)))
+
+
+def parse_org_chart_json(content: str | bytes) -> list[OrgChartRow]:
+    """Parse JSON list of ``{"name": ..., "parent": ...}`` objects."""
+    return list(starmap(_make_row, enumerate(orjson.loads(content), start=1)))
+
+
+def _make_row(row_number: int, item: Mapping[str, str | None]) -> OrgChartRow:
+    return OrgChartRow(
+        row=row_number,
+        name=(item.get('name') or '').strip(),
+        parent=(item.get('parent') or '').strip(),
+    )
+
+
+def _is_valid_label(name: str) -> bool:
+    try:
+        Ltree.validate(name)
+    except ValueError:
+        return False
+    return len(name) <= NAME_MAX_LENGTH and '.' not in name
+
+
+def _accept_rows(
+    rows: Iterable[OrgChartRow],
+    existing_paths: Mapping[str, str],
+    reserved: set[str],
+    errors: list[OrgChartRowError],
+) -> tuple[dict[str, OrgChartRow], set[str]]:
+    """Split rows into accepted ones keyed by name and names of rejected ones, reporting the rejections."""
+    accepted: dict[str, OrgChartRow] = {}
+    rejected: set[str] = set()
+    for row in rows:
+        if not _is_valid_label(row.name) or row.name in reserved:
+            errors.append(OrgChartRowError(row.row, row.name, 'Invalid subdivision name'))
+        elif row.name in existing_paths:
+            errors.append(OrgChartRowError(row.row, row.name, 'Subdivision already exists'))
+        elif row.name in accepted:
+            errors.append(OrgChartRowError(row.row, row.name, f'Duplicate of row {accepted[row.name].row}'))
+        else:
+            accepted[row.name] = row
+            continue
+        rejected.add(row.name)
+    return accepted, rejected
+
+
+def plan_org_chart_import(
+    rows: Iterable[OrgChartRow],
+    existing_paths: Mapping[str, str],
+    reserved_names: Iterable[str] = (),
+) -> OrgChartImportPlan:
+    """Validate rows, order them parents first and compute their ltree paths in memory.
+
+    ``existing_paths`` maps names of subdivisions already stored for the company to their paths.
+    Rows that cannot be imported are reported in ``errors`` together with all their descendants.
+    """
+    plan = OrgChartImportPlan()
+    accepted, rejected = _accept_rows(rows, existing_paths, set(reserved_names), plan.errors)
+
+    children: defaultdict[str, list[OrgChartRow]] = defaultdict(list)
+    queue: deque[tuple[OrgChartRow, str]] = deque()
+    for row in accepted.values():
+        if not row.parent or row.parent == row.name:
+            queue.append((row, row.name))
+        elif row.parent in existing_paths:
+            queue.append((row, f'{existing_paths[row.parent]}.{row.name}'))
+        else:
+            children[row.parent].append(row)
+
+    while queue:
+        row, path = queue.popleft()
+        plan.records.append((row.name, path))
+        plan.rows_by_name[row.name] = row.row
+        queue.extend((child, f'{path}.{child.name}') for child in children.pop(row.name, ()))
+
+    for parent, orphans in children.items():
+        if parent in accepted or parent in rejected:
+            detail = 'Parent is not importable or forms a cycle'
+        else:
+            detail = 'Parent not found'
+        plan.errors.extend(OrgChartRowError(row.row, row.name, detail) for row in orphans)
+    plan.errors.sort(key=lambda error: error.row)
+    return plan
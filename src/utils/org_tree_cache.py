@@ -0,0 +1,119 @@
+"""The module contains the in-process cache of company subdivision trees."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from itertools import count
+
+from pydantic import UUID4
+from sqlalchemy import Row
+
+from src.config import settings
+
+
+class OrgTreeNode:
+    __slots__ = ('children', 'id', 'manager_id', 'name', 'parent', 'path')
+
+    def __init__(self, subdivision_id: int, name: str, path: str, manager_id: UUID4 | None) -> None:
+        self.id = subdivision_id
+        self.name = name
+        self.path = path
+        self.manager_id = manager_id
+        self.parent: OrgTreeNode | None = None
+        self.children: list[OrgTreeNode] = []
+
+
+class OrgTree:
+    """Subdivision hierarchy of one company indexed by id and path."""
+
+    __slots__ = ('by_id', 'by_path', 'loaded_at', 'roots')
+
+    def __init__(self, rows: Iterable[Row]) -> None:
+        """Build the tree from ``(id, name, path, manager_id)`` rows ordered by path."""
+        self.by_id: dict[int, OrgTreeNode] = {}
+        self.by_path: dict[str, OrgTreeNode] = {}
+        self.roots: list[OrgTreeNode] = []
+        self.loaded_at = time.monotonic()
+        for row in rows:
+            path = str(row.path)
+            node = OrgTreeNode(row.id, row.name, path, row.manager_id)
+            parent_path, _, _ = path.rpartition('.')
+            node.parent = self.by_path.get(parent_path) if parent_path else None
+            if node.parent is None:
+                self.roots.append(node)
+            else:
+                node.parent.children.append(node)
+            self.by_id[node.id] = node
+            self.by_path[path] = node
+
+    def get_children(self, subdivision_id: int) -> list[OrgTreeNode]:
+        node = self.by_id.get(subdivision_id)
+        return list(node.children) if node else []
+
+    def get_ancestors(self, subdivision_id: int) -> list[OrgTreeNode]:
+        """Get ancestors of subdivision ordered from the top-level one down to its parent."""
+        ancestors = []
+        node = self.by_id.get(subdivision_id)
+        parent = node.parent if node else None
+        while parent is not None:
+            ancestors.append(parent)
+            parent = parent.parent
+        ancestors.reverse()
+        return ancestors
+
+
+class OrgTreeCache:
+    """LRU cache of company trees bounded by number of companies.
+
+    Every process keeps its own copy, so entries also expire after ``ttl_seconds``
+    to bound staleness caused by mutations handled in other workers.
+
+    Invalidation generations are kept for the ``max_companies`` most recently invalidated companies.
+    Companies without an entry report the highest evicted generation, so a load that raced
+    an invalidation is still not cached after the entry is evicted.
+    """
+
+    def __init__(self, max_companies: int, ttl_seconds: float) -> None:
+        self.max_companies = max_companies
+        self.ttl_seconds = ttl_seconds
+        self._trees: OrderedDict[UUID4, OrgTree] = OrderedDict()
+        self._generations: OrderedDict[UUID4, int] = OrderedDict()
+        self._evicted_generation = 0
+        self._counter = count(1)
+
+    def get(self, company_id: UUID4) -> OrgTree | None:
+        tree = self._trees.get(company_id)
+        if tree is None:
+            return None
+        if time.monotonic() - tree.loaded_at > self.ttl_seconds:
+            del self._trees[company_id]
+            return None
+        self._trees.move_to_end(company_id)
+        return tree
+
+    def generation(self, company_id: UUID4) -> int:
+        """Get the invalidation generation to pass to ``put`` for a tree that is about to be loaded."""
+        return self._generations.get(company_id, self._evicted_generation)
+
+    def put(self, company_id: UUID4, tree: OrgTree, generation: int) -> None:
+        """Store the loaded tree unless the company was invalidated while it was being loaded."""
+        if self.generation(company_id) != generation:
+            return
+        self._trees[company_id] = tree
+        self._trees.move_to_end(company_id)
+        while len(self._trees) > self.max_companies:
+            self._trees.popitem(last=False)
+
+    def invalidate(self, company_id: UUID4) -> None:
+        self._generations[company_id] = next(self._counter)
+        self._generations.move_to_end(company_id)
+        while len(self._generations) > self.max_companies:
+            _, generation = self._generations.popitem(last=False)
+            self._evicted_generation = max(self._evicted_generation, generation)
+        self._trees.pop(company_id, None)
+
+
+org_tree_cache = OrgTreeCache(
+    max_companies=settings.org_tree_cache.max_companies,
+    ttl_seconds=settings.org_tree_cache.ttl_seconds,
+)
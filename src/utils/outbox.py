@@ -0,0 +1,190 @@
+"""The module contains the dispatcher delivering messages written to the outbox table."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from email.message import EmailMessage
+
+from loguru import logger
+
+from src.config import settings
+from src.models.outbox import OutboxModel
+from src.utils.auth.invite_token import INVITATION_EMAIL_TOPIC, build_invitation_email
+from src.utils.mail import mail_queue
+from src.utils.metrics import metrics
+from src.utils.unit_of_work import UnitOfWork
+
+MESSAGE_BUILDERS: dict[str, Callable[[OutboxModel], EmailMessage]] = {
+    INVITATION_EMAIL_TOPIC: lambda message: build_invitation_email(
+        message.recipient, message.payload['invite_token'],
+    ),
+}
+
+
+class OutboxDispatcher:
+    """Background task leasing due outbox messages in batches and handing them to the mail queue.
+
+    Batches are claimed with ``FOR UPDATE SKIP LOCKED``, so any number of workers and processes
+    can run a dispatcher against the same table without sending a message twice while its lease holds.
+    Every claim is a single send attempt bounded by ``delivery_timeout``, shorter than the lease,
+    and retries are scheduled by the outbox. Results of a lease taken over by another dispatcher
+    are discarded.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        poll_interval: float,
+        lease_seconds: float,
+        max_attempts: int,
+        retry_base_delay: float,
+        delivery_timeout: float,
+    ) -> None:
+        if delivery_timeout >= lease_seconds:
+            msg = f'Outbox delivery timeout {delivery_timeout}s must be shorter than {lease_seconds}s lease'
+            raise ValueError(msg)
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.delivery_timeout = delivery_timeout
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start dispatching, unless the mail queue is not running, then messages stay pending."""
+        if not mail_queue.is_running:
+            logger.warning('Mail queue is not running, outbox messages stay pending')
+            return
+        self._task = asyncio.create_task(self._run(), name='outbox-dispatcher')
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                dispatched = await self.dispatch_batch()
+            except Exception:
+                logger.exception('Outbox dispatch failed')
+                dispatched = 0
+            if dispatched < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def dispatch_batch(self) -> int:
+        """Deliver one batch of due messages concurrently, return number of claimed messages."""
+        uow = UnitOfWork()
+        async with uow:
+            lag = await uow.outbox.get_lag_seconds()
+            messages = await uow.outbox.claim_batch(limit=self.batch_size, lease_seconds=self.lease_seconds)
+        metrics.set_gauge('outbox_lag_seconds', lag)
+        if not messages:
+            return 0
+
+        started_at = time.perf_counter()
+        errors = await asyncio.gather(*(self._deliver(message) for message in messages))
+        metrics.observe('outbox_batch_seconds', time.perf_counter() - started_at)
+
+        sent = [message for message, error in zip(messages, errors, strict=True) if error is None]
+        async with uow:
+            await uow.outbox.mark_sent(sent)
+            for message, error in zip(messages, errors, strict=True):
+                if error is not None:
+                    await uow.outbox.mark_failed(
+                        message,
+                        error=error,
+                        retry_delay=self.retry_base_delay * 2 ** (message.attempts - 1),
+                        max_attempts=self.max_attempts,
+                    )
+        metrics.inc('outbox_messages_total', len(sent), result='sent')
+        metrics.inc('outbox_messages_total', len(messages) - len(sent), result='failed')
+        return len(messages)
+
+    async def _deliver(self, message: OutboxModel) -> str | None:
+        """Send message through the mail queue, return error if it was not delivered in time."""
+        builder = MESSAGE_BUILDERS.get(message.topic)
+        if builder is None:
+            return f'Unknown outbox topic {message.topic!r}'
+        try:
+            email = builder(message)
+        except Exception as e:
+            logger.exception(f'Failed to build outbox message {message.id}')
+            return f'Invalid outbox message: {e!r}'
+
+        result: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+
+        def resolve(error: str | None) -> None:
+            if not result.done():
+                result.set_result(error)
+
+        try:
+            async with asyncio.timeout(self.delivery_timeout):
+                await mail_queue.enqueue(
+                    email, on_result=resolve, max_attempts=1, expires_in=self.delivery_timeout,
+                )
+                return await result
+        except TimeoutError:
+            return f'Delivery timed out after {self.delivery_timeout}s'
+
+
+class OutboxPruner:
+    """Background task deleting delivered and failed messages once they are ``retention_seconds`` old.
+
+    Payloads carry secrets such as invitation tokens, so settled messages are not kept longer
+    than job statuses need them. Rows are deleted in batches, each in its own transaction.
+    """
+
+    batch_size = 1000
+
+    def __init__(self, retention_seconds: float, interval: float) -> None:
+        self.retention_seconds = retention_seconds
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name='outbox-pruner')
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.prune()
+            except Exception:
+                logger.exception('Outbox pruning failed')
+            await asyncio.sleep(self.interval)
+
+    async def prune(self) -> int:
+        """Delete every settled message past retention, return number of deleted messages."""
+        uow = UnitOfWork()
+        total = 0
+        while True:
+            async with uow:
+                deleted = await uow.outbox.delete_settled(self.retention_seconds, limit=self.batch_size)
+            total += deleted
+            if deleted < self.batch_size:
+                break
+        metrics.inc('outbox_pruned_total', total)
+        return total
+
+
+outbox_dispatcher = OutboxDispatcher(
+    batch_size=settings.outbox.batch_size,
+    poll_interval=settings.outbox.poll_interval_seconds,
+    lease_seconds=settings.outbox.lease_seconds,
+    max_attempts=settings.outbox.max_attempts,
+    retry_base_delay=settings.outbox.retry_base_delay_seconds,
+    delivery_timeout=settings.outbox.delivery_timeout_seconds,
+)
+
+outbox_pruner = OutboxPruner(
+    retention_seconds=settings.outbox.retention_seconds,
+    interval=settings.outbox.prune_interval_seconds,
+)
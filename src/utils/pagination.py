@@ -0,0 +1,53 @@
+"""The module contains pages and opaque cursors of keyset (seek) pagination."""
+
+import base64
+import binascii
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import starmap
+from typing import Any, Generic, NoReturn, TypeVar
+
+import orjson
+from fastapi import HTTPException
+from starlette import status
+
+T = TypeVar('T')
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: Sequence[T]
+    next_cursor: str | None = None
+    total_estimate: int | None = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values of the last returned row into an opaque URL-safe cursor."""
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> list[Any]:
+    """Decode cursor produced by ``encode_cursor`` into sort key values of the given ``types``."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        values = None
+    if not isinstance(values, list) or len(values) != len(types):
+        _raise_invalid_cursor()
+    try:
+        return list(starmap(_cursor_value, zip(values, types, strict=True)))
+    except (TypeError, ValueError):
+        _raise_invalid_cursor()
+
+
+def _cursor_value(value: Any, value_type: type) -> Any:
+    if isinstance(value, value_type):
+        return value
+    if value_type is datetime:
+        return datetime.fromisoformat(value)
+    return value_type(value)
+
+
+def _raise_invalid_cursor() -> NoReturn:
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid cursor')
@@ -1,14 +1,21 @@
 """The module contains base classes for working with databases."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Never, TypeVar
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, Never, TypeVar
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select, update
+from fastapi import HTTPException
+from sqlalchemy import Column, ColumnElement, Select, delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from starlette.status import HTTP_400_BAD_REQUEST
 
+from src.config import settings
 from src.models import BaseModel
+from src.schemas.filter import BaseFilter
+from src.utils.pagination import Page, decode_cursor, encode_cursor
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Result
@@ -51,14 +58,28 @@ class AbstractRepository(ABC):
 M = TypeVar('M', bound=BaseModel)
 
 
+def _column_default(column: Column) -> Any:
+    if column.default.is_callable:
+        return column.default.arg(None)
+    return column.default.arg
+
+
 class SqlAlchemyRepository(AbstractRepository):
     """A basic repository that implements basic CRUD functions with a base table using the SqlAlchemy library.
 
     params:
         - model: SQLAlchemy child DeclarativeBase class
+        - case_insensitive_fields: fields matched on lower(), backed by lower() functional indexes
+        - bulk_batch_size: rows sent per statement by the bulk methods
+        - bulk_copy_threshold: number of rows from which add_many without RETURNING switches to COPY
+        - page_count_limit: number of rows up to which get_page counts the total
     """
 
     model: M
+    case_insensitive_fields: ClassVar[tuple[str, ...]] = ('email', 'username')
+    bulk_batch_size: ClassVar[int] = settings.repository_bulk.batch_size
+    bulk_copy_threshold: ClassVar[int] = settings.repository_bulk.copy_threshold
+    page_count_limit: ClassVar[int] = settings.pagination.count_limit
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -77,15 +98,118 @@ class SqlAlchemyRepository(AbstractRepository):
         obj: Result = await self.session.execute(query)
         return obj.scalar_one()
 
+    async def add_many(self, rows: Sequence[dict[str, Any]], *, returning: bool = False) -> Sequence[M]:
+        """Insert rows in multi-row VALUES statements of ``bulk_batch_size`` rows.
+
+        Without ``returning`` a load of at least ``bulk_copy_threshold`` rows goes through COPY instead,
+        rows must then share the same keys and columns left out get their defaults.
+        """
+        if not rows:
+            return []
+        if not returning and len(rows) >= self.bulk_copy_threshold:
+            await self._copy_rows(rows)
+            return []
+        created: list[M] = []
+        for batch in self._batches(rows):
+            if returning:
+                res: Result = await self.session.execute(insert(self.model).returning(self.model), batch)
+                created.extend(res.scalars().all())
+            else:
+                await self.session.execute(insert(self.model), batch)
+        return created
+
+    async def update_many(self, rows: Sequence[dict[str, Any]]) -> None:
+        """Update rows by primary key, every row holds ``id`` and the values to set."""
+        for batch in self._batches(rows):
+            await self.session.execute(update(self.model), batch)
+
+    async def upsert_many(
+        self,
+        rows: Sequence[dict[str, Any]],
+        *,
+        index_elements: Sequence[str] | None = None,
+        constraint: str | None = None,
+        update_columns: Sequence[str] | None = None,
+        returning: bool = False,
+    ) -> Sequence[M]:
+        """Insert rows, resolving conflicts on ``index_elements`` or ``constraint``.
+
+        Conflicting rows get ``update_columns`` overwritten with the proposed values, by default every
+        given column except ``id`` and ``index_elements``; with no columns to update they are skipped.
+        With ``returning`` only inserted and updated rows are returned. A conflict target may appear
+        only once per batch, Postgres refuses to update the same row twice in one statement.
+        """
+        if not rows:
+            return []
+        if update_columns is None:
+            update_columns = [key for key in rows[0] if key != 'id' and key not in (index_elements or ())]
+        upserted: list[M] = []
+        for batch in self._batches(rows):
+            query = insert(self.model).values(batch)
+            if update_columns:
+                query = query.on_conflict_do_update(
+                    index_elements=index_elements,
+                    constraint=constraint,
+                    set_={column: query.excluded[column] for column in update_columns},
+                )
+            else:
+                query = query.on_conflict_do_nothing(index_elements=index_elements, constraint=constraint)
+            if returning:
+                res: Result = await self.session.execute(query.returning(self.model))
+                upserted.extend(res.scalars().all())
+            else:
+                await self.session.execute(query)
+        return upserted
+
+    def _batches(self, rows: Sequence[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
+        for start in range(0, len(rows), self.bulk_batch_size):
+            yield list(rows[start:start + self.bulk_batch_size])
+
+    async def _copy_rows(self, rows: Sequence[dict[str, Any]]) -> None:
+        """Load rows with COPY, filling Python-side defaults of the omitted columns.
+
+        Values pass the same bind processing as in INSERT statements, so enums, JSON and UUID columns
+        are encoded the way asyncpg expects them.
+        """
+        connection = await self.session.connection()
+        table = self.model.__table__
+        given = [table.c[key] for key in rows[0]]
+        defaulted = [
+            column for column in table.c
+            if column.key not in rows[0] and column.default is not None
+            and (column.default.is_scalar or column.default.is_callable)
+        ]
+        columns = [*given, *defaulted]
+        dialect = connection.dialect
+        processors = [column.type.dialect_impl(dialect).bind_processor(dialect) for column in columns]
+        records = []
+        for row in rows:
+            values = [
+                *(row[column.key] for column in given), *(_column_default(column) for column in defaulted),
+            ]
+            records.append(
+                tuple(
+                    processor(value) if processor else value
+                    for processor, value in zip(processors, values, strict=True)
+                ),
+            )
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name, records=records, columns=[column.name for column in columns],
+        )
+
     async def get_by_query_one_or_none(self, **kwargs: Any) -> M | None:
-        if 'email' in kwargs:
-            email_filter = self.model.email.ilike(kwargs['email'])
-            query = select(self.model).where(email_filter)
-        elif 'username' in kwargs:
-            username_filter = self.model.username.ilike(kwargs['username'])
-            query = select(self.model).where(username_filter)
-        else:
-            query = select(self.model).filter_by(**kwargs)
+        case_insensitive = {
+            field: kwargs.pop(field)
+            for field in self.case_insensitive_fields
+            if kwargs.get(field) is not None
+        }
+        query = select(self.model).filter_by(**kwargs).where(
+            *(
+                func.lower(getattr(self.model, field)) == func.lower(value)
+                for field, value in case_insensitive.items()
+            ),
+        )
 
         res: Result = await self.session.execute(query)
         return res.unique().scalar_one_or_none()
@@ -95,6 +219,62 @@ class SqlAlchemyRepository(AbstractRepository):
         res: Result = await self.session.execute(query)
         return res.scalars().all()
 
+    async def get_page(
+        self,
+        filters: BaseFilter,
+        query: Select | None = None,
+        sort_columns: Sequence[InstrumentedAttribute] = (),
+        *,
+        descending: bool = False,
+        ranked_by: ColumnElement | None = None,
+    ) -> Page[M]:
+        """Get page of ``query`` results, all rows of the model by default, described by ``filters``.
+
+        Rows are ordered by non-nullable ``sort_columns`` followed by ``id`` as a tie-breaker. A cursor
+        continues after the sort key it holds, which stays fast on an index over the same columns,
+        otherwise ``filters.offset`` rows are skipped. Rows ranked by a computed ``ranked_by`` value,
+        highest first, are paginated by offset only. With ``filters.with_total`` the page carries
+        the number of matching rows, counted up to ``page_count_limit``.
+        """
+        query = select(self.model) if query is None else query
+        columns = [*sort_columns, self.model.id]
+        total_estimate = await self._count(query) if filters.with_total else None
+
+        if ranked_by is not None:
+            if filters.cursor:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail='Ranked results are paginated by page, not by cursor',
+                )
+            query = query.order_by(ranked_by.desc())
+
+        if filters.cursor:
+            after = tuple_(*decode_cursor(filters.cursor, [column.type.python_type for column in columns]))
+            query = query.where(tuple_(*columns) < after if descending else tuple_(*columns) > after)
+        else:
+            query = query.offset(filters.offset)
+
+        query = query.order_by(*(column.desc() if descending else column for column in columns))
+        res: Result = await self.session.execute(query.limit(filters.limit + 1))
+        items = res.scalars().all()
+
+        next_cursor = None
+        if len(items) > filters.limit:
+            items = items[:filters.limit]
+            if ranked_by is None:
+                next_cursor = encode_cursor([getattr(items[-1], column.key) for column in columns])
+        return Page(items=items, next_cursor=next_cursor, total_estimate=total_estimate)
+
+    async def _count(self, query: Select) -> int:
+        bounded = (
+            query.with_only_columns(self.model.id, maintain_column_froms=True)
+            .order_by(None)
+            .limit(self.page_count_limit)
+            .subquery()
+        )
+        res: Result = await self.session.execute(select(func.count()).select_from(bounded))
+        return res.scalar_one()
+
     async def update_one_by_id(self, obj_id: int | str | UUID, **kwargs: Any) -> M | None:
         query = update(self.model).filter(self.model.id == obj_id).values(**kwargs).returning(self.model)
         obj: Result | None = await self.session.execute(query)
@@ -0,0 +1,38 @@
+"""The module contains helpers for serializing the subdivision hierarchy."""
+
+from collections.abc import AsyncIterable, AsyncIterator
+
+import orjson
+from sqlalchemy import Row
+
+from src.schemas.response import BaseResponse
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def iter_subdivision_tree_json(rows: AsyncIterable[Row]) -> AsyncIterator[bytes]:
+    """Serialize path-ordered subdivision rows into a nested JSON response in one linear pass.
+
+    Rows must come ordered by ``path`` so that every node directly follows its ancestors.
+    Only the chain of currently open nodes is kept in memory, output is yielded in chunks.
+    """
+    buffer = bytearray(orjson.dumps(BaseResponse().model_dump())[:-1] + b',"payload":[')
+    open_levels: list[int] = []
+    needs_comma = False
+    async for row in rows:
+        level = len(row.path)
+        while open_levels and open_levels[-1] >= level:
+            open_levels.pop()
+            buffer += b']}'
+            needs_comma = True
+        if needs_comma:
+            buffer += b','
+        node = {'id': row.id, 'name': row.name, 'path': row.path.path, 'manager_id': row.manager_id}
+        buffer += orjson.dumps(node)[:-1] + b',"children":['
+        open_levels.append(level)
+        needs_comma = False
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b']}' * len(open_levels) + b']}'
+    yield bytes(buffer)
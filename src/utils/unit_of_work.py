@@ -1,20 +1,33 @@
 """The module contains base classes for supporting transactions."""
 
+import asyncio
 import functools
+import random
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from types import TracebackType
 from typing import Any, Never
 
+from sqlalchemy.exc import DBAPIError
+
+from src.config import settings
 from src.database.db import async_session_maker
 from src.repositories import (
     CompanyRepository,
+    OutboxRepository,
     PositionAssignmentRepository,
     PositionInSubdivisionRepository,
     PositionRepository,
     SubdivisionRepository,
+    SubdivisionStatsRepository,
     UserRepository,
 )
 from src.utils.custom_types import AsyncFunc
+from src.utils.metrics import metrics
+
+RETRYABLE_SQLSTATES = frozenset({'40001', '40P01'})
+
+_jitter = random.SystemRandom()
 
 
 class AbstractUnitOfWork(ABC):
@@ -52,16 +65,20 @@ class UnitOfWork(AbstractUnitOfWork):
     def __init__(self) -> None:
         self.session_factory = async_session_maker
         self.is_open = False
+        self._after_commit: list[Callable[[], None]] = []
 
     async def __aenter__(self) -> None:
         self.session = self.session_factory()
         self.company = CompanyRepository(self.session)
         self.user = UserRepository(self.session)
         self.subdivision = SubdivisionRepository(self.session)
+        self.subdivision_stats = SubdivisionStatsRepository(self.session)
         self.position = PositionRepository(self.session)
         self.position_assignment = PositionAssignmentRepository(self.session)
         self.position_in_subdivision = PositionInSubdivisionRepository(self.session)
+        self.outbox = OutboxRepository(self.session)
 
+        self._after_commit = []
         self.is_open = True
 
     async def __aexit__(
@@ -70,12 +87,18 @@ class UnitOfWork(AbstractUnitOfWork):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        callbacks, self._after_commit = self._after_commit, []
+        try:
+            if not exc_type:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+            self.is_open = False
         if not exc_type:
-            await self.commit()
-        else:
-            await self.rollback()
-        await self.session.close()
-        self.is_open = False
+            for callback in callbacks:
+                callback()
 
     async def commit(self) -> None:
         await self.session.commit()
@@ -86,6 +109,10 @@ class UnitOfWork(AbstractUnitOfWork):
     async def rollback(self) -> None:
         await self.session.rollback()
 
+    def add_after_commit(self, callback: Callable[[], None]) -> None:
+        """Run the callback once the current transaction is committed."""
+        self._after_commit.append(callback)
+
 
 def transaction_mode(func: AsyncFunc) -> AsyncFunc:
     """Decorate a function with transaction mode."""
@@ -100,3 +127,35 @@ def transaction_mode(func: AsyncFunc) -> AsyncFunc:
             return await func(self, *args, **kwargs)
 
     return wrapper
+
+
+def _get_sqlstate(exc: DBAPIError) -> str | None:
+    for error in (exc.orig, getattr(exc.orig, '__cause__', None)):
+        if sqlstate := getattr(error, 'sqlstate', None) or getattr(error, 'pgcode', None):
+            return sqlstate
+    return None
+
+
+def retry_on_conflict(func: AsyncFunc) -> AsyncFunc:
+    """Retry the whole transaction on serialization failures and deadlocks with jittered backoff.
+
+    Must wrap ``transaction_mode`` so every attempt runs in a fresh transaction,
+    calls made inside an already open transaction are not retried.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if self.uow.is_open:
+            return await func(self, *args, **kwargs)
+        retry_settings = settings.transaction_retry
+        for attempt in range(1, retry_settings.attempts + 1):
+            try:
+                return await func(self, *args, **kwargs)
+            except DBAPIError as exc:
+                if attempt == retry_settings.attempts or _get_sqlstate(exc) not in RETRYABLE_SQLSTATES:
+                    raise
+                metrics.inc('transaction_retries_total', operation=func.__qualname__)
+                await asyncio.sleep(_jitter.uniform(0, retry_settings.base_delay_seconds * 2**attempt))
+        return None
+
+    return wrapper
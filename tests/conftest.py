@@ -0,0 +1,13 @@
+"""Database settings for importing the app in tests, the tests themselves never connect to it."""
+
+import os
+
+for name, value in {
+    'MODE': 'TEST',
+    'DB_HOST': 'localhost',
+    'DB_PORT': '5432',
+    'DB_USER': 'postgres',
+    'DB_PASS': 'postgres',
+    'DB_NAME': 'postgres',
+}.items():
+    os.environ.setdefault(name, value)
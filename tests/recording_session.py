@@ -0,0 +1,35 @@
+from sqlalchemy import Executable
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Compiled
+
+
+class EmptyResult:
+    rowcount = 0
+
+    def scalars(self) -> 'EmptyResult':
+        return self
+
+    def unique(self) -> 'EmptyResult':
+        return self
+
+    @staticmethod
+    def scalar_one_or_none() -> None:
+        return None
+
+    @staticmethod
+    def all() -> list:
+        return []
+
+
+class RecordingSession:
+    """Session stand-in recording executed statements instead of sending them to the database."""
+
+    def __init__(self) -> None:
+        self.statements: list[Executable] = []
+
+    async def execute(self, statement: Executable) -> EmptyResult:
+        self.statements.append(statement)
+        return EmptyResult()
+
+    def compiled(self, index: int = 0) -> Compiled:
+        return self.statements[index].compile(dialect=postgresql.asyncpg.dialect())
@@ -0,0 +1,51 @@
+import asyncio
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from src.api.v1.services import UserService
+from src.schemas.user import UserDB
+from src.utils.auth.jwt_tools import ACCESS_TOKEN_TYPE, REFRESH_TOKEN_TYPE, TOKEN_TYPE_FIELD
+from src.utils.auth.user_cache import auth_user_cache
+from src.utils.auth.validators import get_auth_user_from_token_of_type
+
+
+def make_user(*, active: bool) -> UserDB:
+    return UserDB(
+        id=uuid4(), username='cached', first_name='Ann', last_name='Lee', company_id=uuid4(), active=active,
+    )
+
+
+class StoredUser:
+    def __init__(self, user: UserDB) -> None:
+        self.user = user
+        self.updated_at = datetime.now(UTC)
+
+    def to_pydantic_schema(self) -> UserDB:
+        return self.user
+
+
+class UserServiceStub(UserService):
+    def __init__(self, user: UserDB) -> None:
+        super().__init__()
+        self.stored = StoredUser(user)
+        self.lookups = 0
+
+    async def get_user_by_username(self, username: str) -> StoredUser:
+        assert username == self.stored.user.username
+        self.lookups += 1
+        return self.stored
+
+
+def authenticate(token_type: str, service: UserServiceStub) -> UserDB:
+    payload = {'sub': 'cached', TOKEN_TYPE_FIELD: token_type}
+    return asyncio.run(get_auth_user_from_token_of_type(token_type)(payload, service))
+
+
+def test_refresh_token_reads_user_from_database_despite_cache() -> None:
+    cached = make_user(active=True)
+    auth_user_cache.put(cached, updated_at=datetime.now(UTC), generation=auth_user_cache.generation())
+    service = UserServiceStub(make_user(active=False))
+
+    assert authenticate(ACCESS_TOKEN_TYPE, service) == cached
+    assert authenticate(REFRESH_TOKEN_TYPE, service).active is False
+    assert service.lookups == 1
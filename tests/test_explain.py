@@ -0,0 +1,33 @@
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.cli.explain import Explain, plan_indexes
+from src.models.subdivision import SubdivisionModel
+
+
+def test_explain_wraps_statement_and_keeps_its_params() -> None:
+    company_id = uuid.uuid4()
+    statement = select(SubdivisionModel.id).where(SubdivisionModel.company_id == company_id)
+
+    compiled = Explain(statement).compile(dialect=postgresql.asyncpg.dialect())
+
+    assert str(compiled).startswith('EXPLAIN (FORMAT JSON) SELECT subdivision.id')
+    assert list(compiled.construct_params().values()) == [company_id]
+
+
+def test_plan_indexes_collects_nested_index_scans() -> None:
+    plan = {
+        'Node Type': 'Nested Loop',
+        'Plans': [
+            {'Node Type': 'Index Scan', 'Index Name': 'subdivision_pkey'},
+            {
+                'Node Type': 'Bitmap Heap Scan',
+                'Plans': [{'Node Type': 'Bitmap Index Scan', 'Index Name': 'ix_subdivision_path_gist'}],
+            },
+            {'Node Type': 'Seq Scan', 'Relation Name': 'position'},
+        ],
+    }
+
+    assert plan_indexes(plan) == {'subdivision_pkey', 'ix_subdivision_path_gist'}
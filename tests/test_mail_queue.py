@@ -0,0 +1,78 @@
+import asyncio
+from email.message import EmailMessage
+
+import pytest
+
+from src.config import settings
+from src.utils import mail
+from src.utils.mail import MailQueue
+
+
+class FlakyConnection:
+    """Connection failing the first message with an error the queue does not expect."""
+
+    def __init__(self, hostname: str, port: int) -> None:
+        self.address = (hostname, port)
+        self.sent: list[str] = []
+
+    async def send(self, message: EmailMessage) -> None:
+        if not self.sent and message['To'] == 'broken@example.com':
+            self.sent.append('')
+            msg = 'unexpected'
+            raise TypeError(msg)
+        self.sent.append(message['To'])
+
+    async def close(self) -> None:
+        pass
+
+
+def make_message(recipient: str) -> EmailMessage:
+    message = EmailMessage()
+    message['To'] = recipient
+    return message
+
+
+def test_worker_reports_unexpected_error_and_keeps_running(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.email, 'smtp_server', 'localhost')
+    monkeypatch.setattr(settings.email, 'smtp_port', '25')
+    monkeypatch.setattr(mail, 'SMTPConnection', FlakyConnection)
+
+    async def run() -> list[str | None]:
+        queue = MailQueue(workers=1, max_size=10, max_attempts=3, base_delay=0)
+        queue.start()
+        results: list[str | None] = []
+        await queue.enqueue(make_message('broken@example.com'), on_result=results.append)
+        await queue.enqueue(make_message('ok@example.com'), on_result=results.append)
+        await queue.stop(grace_period=1)
+        return results
+
+    assert asyncio.run(run()) == ['unexpected', None]
+
+
+def test_expired_message_is_reported_without_sending(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.email, 'smtp_server', 'localhost')
+    monkeypatch.setattr(settings.email, 'smtp_port', '25')
+    monkeypatch.setattr(mail, 'SMTPConnection', FlakyConnection)
+
+    async def run() -> list[str | None]:
+        queue = MailQueue(workers=1, max_size=10, max_attempts=3, base_delay=0)
+        results: list[str | None] = []
+        await queue.enqueue(make_message('late@example.com'), on_result=results.append, expires_in=0)
+        queue.start()
+        await queue.stop(grace_period=1)
+        return results
+
+    assert asyncio.run(run()) == ['Expired before it could be sent']
+
+
+def test_queue_without_smtp_address_stays_stopped_and_fails_messages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.email, 'smtp_port', None)
+
+    async def run() -> tuple[bool, list[str | None]]:
+        queue = MailQueue(workers=1, max_size=10, max_attempts=3, base_delay=0)
+        queue.start()
+        results: list[str | None] = []
+        await queue.enqueue(make_message('user@example.com'), on_result=results.append)
+        return queue.is_running, results
+
+    assert asyncio.run(run()) == (False, ['SMTP server is not configured'])
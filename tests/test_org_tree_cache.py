@@ -0,0 +1,36 @@
+from uuid import uuid4
+
+from src.utils.org_tree_cache import OrgTree, OrgTreeCache
+
+
+def test_generations_of_least_recently_invalidated_companies_are_evicted() -> None:
+    cache = OrgTreeCache(max_companies=2, ttl_seconds=60)
+    evicted, kept = uuid4(), uuid4()
+    cache.invalidate(evicted)
+    cache.invalidate(kept)
+    cache.invalidate(uuid4())
+
+    assert cache.generation(evicted) == cache.generation(uuid4())
+    assert cache.generation(kept) != cache.generation(uuid4())
+
+
+def test_load_racing_invalidation_is_not_cached_after_generation_eviction() -> None:
+    cache = OrgTreeCache(max_companies=1, ttl_seconds=60)
+    company_id = uuid4()
+    generation = cache.generation(company_id)
+
+    cache.invalidate(company_id)
+    cache.invalidate(uuid4())
+    cache.put(company_id, OrgTree([]), generation)
+
+    assert cache.get(company_id) is None
+
+
+def test_load_without_invalidation_is_cached() -> None:
+    cache = OrgTreeCache(max_companies=1, ttl_seconds=60)
+    company_id = uuid4()
+    tree = OrgTree([])
+
+    cache.put(company_id, tree, cache.generation(company_id))
+
+    assert cache.get(company_id) is tree
@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from src.utils import outbox
+from src.utils.mail import MailQueue
+from src.utils.outbox import OutboxDispatcher
+
+
+def test_dispatcher_leaves_messages_pending_without_mail_queue(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(outbox, 'mail_queue', MailQueue(workers=1, max_size=10, max_attempts=1, base_delay=0))
+    batches: list[int] = []
+
+    async def dispatch_batch(_dispatcher: OutboxDispatcher) -> int:
+        batches.append(1)
+        await asyncio.sleep(0)
+        return 0
+
+    monkeypatch.setattr(OutboxDispatcher, 'dispatch_batch', dispatch_batch)
+
+    async def run() -> None:
+        dispatcher = OutboxDispatcher(
+            batch_size=1,
+            poll_interval=0,
+            lease_seconds=2,
+            max_attempts=1,
+            retry_base_delay=0,
+            delivery_timeout=1,
+        )
+        dispatcher.start()
+        await asyncio.sleep(0.01)
+        await dispatcher.stop()
+
+    asyncio.run(run())
+    assert batches == []
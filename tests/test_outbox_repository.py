@@ -0,0 +1,43 @@
+import asyncio
+
+from sqlalchemy import Enum
+
+from src.models.outbox import OutboxModel
+from src.repositories.outbox import OutboxRepository
+from src.schemas.outbox import OutboxStatus
+from tests.recording_session import RecordingSession
+
+
+def test_mark_failed_binds_status_as_enum() -> None:
+    session = RecordingSession()
+    repository = OutboxRepository(session)
+    message = OutboxModel(id=1, attempts=2)
+    asyncio.run(repository.mark_failed(message, error='boom', retry_delay=30, max_attempts=5))
+
+    compiled = session.compiled()
+    status_binds = [bind for bind in compiled.binds.values() if isinstance(bind.value, OutboxStatus)]
+
+    assert {bind.value for bind in status_binds} == {OutboxStatus.FAILED, OutboxStatus.PENDING}
+    assert all(isinstance(bind.type, Enum) for bind in status_binds)
+
+
+def test_mark_sent_only_updates_messages_still_leased() -> None:
+    session = RecordingSession()
+    repository = OutboxRepository(session)
+    asyncio.run(repository.mark_sent([OutboxModel(id=1, attempts=3)]))
+
+    compiled = session.compiled()
+
+    assert '(outbox.id, outbox.attempts) IN' in str(compiled)
+    assert compiled.construct_params()['param_1'] == [(1, 3)]
+
+
+def test_delete_settled_skips_pending_messages() -> None:
+    session = RecordingSession()
+    repository = OutboxRepository(session)
+    asyncio.run(repository.delete_settled(older_than_seconds=86400, limit=1000))
+
+    compiled = session.compiled()
+
+    assert str(compiled).startswith('DELETE FROM outbox')
+    assert OutboxStatus.PENDING in compiled.construct_params().values()
@@ -0,0 +1,42 @@
+import asyncio
+import uuid
+
+from src.repositories import PositionAssignmentRepository
+from tests.recording_session import RecordingSession
+
+POSITION_ID = 3
+
+
+def test_remove_users_except_deletes_other_users_of_position() -> None:
+    session = RecordingSession()
+    user_id = uuid.uuid4()
+    repository = PositionAssignmentRepository(session)
+    asyncio.run(repository.remove_users_except(position_id=POSITION_ID, user_ids=[user_id]))
+
+    compiled = session.compiled()
+    sql = str(compiled)
+    assert sql.startswith('DELETE FROM position_assignment')
+    assert 'position_assignment.user_id NOT IN' in sql
+    assert sql.endswith('RETURNING position_assignment.user_id')
+    params = list(compiled.construct_params().values())
+    assert POSITION_ID in params
+    assert [user_id] in params
+
+
+def test_add_company_users_inserts_from_company_users_in_one_statement() -> None:
+    session = RecordingSession()
+    user_ids = [uuid.uuid4(), uuid.uuid4()]
+    company_id = uuid.uuid4()
+    asyncio.run(
+        PositionAssignmentRepository(session).add_company_users(
+            position_id=POSITION_ID, user_ids=user_ids, company_id=company_id,
+        ),
+    )
+
+    assert len(session.statements) == 1
+    compiled = session.compiled()
+    sql = str(compiled)
+    assert 'INSERT INTO position_assignment (user_id, position_id) SELECT desired.id' in sql
+    assert 'ON CONFLICT ON CONSTRAINT uq_user_position DO NOTHING' in sql
+    assert '"user".company_id = ' in sql
+    assert compiled.binds['user_ids'].value == user_ids
@@ -0,0 +1,22 @@
+import asyncio
+
+from src.repositories import UserRepository
+from tests.recording_session import RecordingSession
+
+
+def test_case_insensitive_lookup_lowers_both_sides() -> None:
+    session = RecordingSession()
+    asyncio.run(UserRepository(session).get_by_query_one_or_none(email='Admin@Example.com'))
+
+    compiled = session.compiled()
+    assert 'lower("user".email) = lower($1::VARCHAR)' in str(compiled)
+    assert list(compiled.construct_params().values()) == ['Admin@Example.com']
+
+
+def test_case_insensitive_lookup_of_none_uses_plain_filter() -> None:
+    session = RecordingSession()
+    asyncio.run(UserRepository(session).get_by_query_one_or_none(email=None))
+
+    sql = str(session.compiled())
+    assert 'lower(' not in sql
+    assert '"user".email IS NULL' in sql
@@ -0,0 +1,130 @@
+import asyncio
+import datetime as dt
+import ipaddress
+import socket
+import ssl
+from collections.abc import Iterator
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Any
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult, Envelope, LoginPassword, Session
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from src.config import settings
+from src.utils.mail import MailQueue
+
+HOST = '127.0.0.1'
+CREDENTIALS = ('mailer', 'secret')
+
+
+class FlakyHandler:
+    """SMTP handler rejecting the first message with a temporary error and accepting the rest."""
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.rejected = 0
+        self.delivered: list[list[str]] = []
+        self.handle_DATA = self.handle_data
+
+    def authenticate(self, *args: Any) -> AuthResult:
+        auth_data: LoginPassword = args[-1]
+        success = (auth_data.login.decode(), auth_data.password.decode()) == CREDENTIALS
+        self.logins += success
+        return AuthResult(success=success)
+
+    async def handle_data(self, _server: Any, _session: Session, envelope: Envelope) -> str:
+        await asyncio.sleep(0)
+        if not self.rejected:
+            self.rejected += 1
+            return '451 Try again later'
+        self.delivered.append(envelope.rcpt_tos)
+        return '250 OK'
+
+
+def write_certificate(path: Path) -> tuple[Path, Path]:
+    """Write a self-signed certificate for ``HOST`` and its key."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, HOST)])
+    now = dt.datetime.now(dt.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - dt.timedelta(minutes=1))
+        .not_valid_after(now + dt.timedelta(hours=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address(HOST))]), critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = path / 'smtp.crt', path / 'smtp.key'
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption(),
+        ),
+    )
+    return cert_path, key_path
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[FlakyHandler]:
+    cert_path, key_path = write_certificate(tmp_path)
+    tls_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    tls_context.load_cert_chain(cert_path, key_path)
+    handler = FlakyHandler()
+    controller = Controller(
+        handler,
+        hostname=HOST,
+        port=free_port(),
+        tls_context=tls_context,
+        require_starttls=True,
+        authenticator=handler.authenticate,
+        auth_required=True,
+    )
+    controller.start()
+    monkeypatch.setenv('SSL_CERT_FILE', str(cert_path))
+    monkeypatch.setattr(settings.email, 'smtp_server', HOST)
+    monkeypatch.setattr(settings.email, 'smtp_port', str(controller.port))
+    monkeypatch.setattr(settings.email, 'smtp_username', CREDENTIALS[0])
+    monkeypatch.setattr(settings.email, 'smtp_password', CREDENTIALS[1])
+    monkeypatch.setattr(settings.email, 'smtp_start_tls', True)
+    monkeypatch.setattr(settings.email, 'smtp_timeout_seconds', 5)
+    yield handler
+    controller.stop()
+
+
+def test_failed_send_is_retried_over_a_new_authenticated_tls_connection(smtp_server: FlakyHandler) -> None:
+    message = EmailMessage()
+    message['From'] = 'noreply@example.com'
+    message['To'] = 'user@example.com'
+    message['Subject'] = 'Invitation'
+    message.set_content('Welcome')
+
+    async def run() -> list[str | None]:
+        queue = MailQueue(workers=1, max_size=10, max_attempts=2, base_delay=0)
+        queue.start()
+        results: list[str | None] = []
+        await queue.enqueue(message, on_result=results.append)
+        await queue.stop(grace_period=5)
+        return results
+
+    assert asyncio.run(run()) == [None]
+    assert smtp_server.rejected == 1
+    assert smtp_server.delivered == [['user@example.com']]
+    assert smtp_server.logins == len([*smtp_server.delivered, smtp_server.rejected])
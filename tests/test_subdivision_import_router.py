@@ -0,0 +1,40 @@
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+from src.api.v1.routers.subdivision import router
+from src.api.v1.services.subdivision import SubdivisionService
+from src.config import settings
+from src.utils.auth.validators import get_current_admin_auth_user
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_admin_auth_user] = object
+    app.dependency_overrides[SubdivisionService] = object
+    return TestClient(app)
+
+
+def test_import_rejects_file_over_size_limit(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.org_chart_import, 'max_file_size_bytes', 16)
+    response = client.post(
+        f'/subdivision/{uuid.uuid4()}/import',
+        files={'file': ('chart.csv', b'name,parent\nSales,\nMarketing,\n', 'text/csv')},
+    )
+
+    assert response.status_code == HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_import_reports_malformed_csv_as_bad_request(client: TestClient) -> None:
+    content = b'name,parent\n' + b'a' * 200_000 + b',\n'
+    response = client.post(
+        f'/subdivision/{uuid.uuid4()}/import', files={'file': ('chart.csv', content, 'text/csv')},
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()['detail'].startswith('Invalid org chart file: field larger than field limit')
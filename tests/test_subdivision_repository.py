@@ -0,0 +1,21 @@
+import asyncio
+import uuid
+
+from sqlalchemy_utils import Ltree
+
+from src.repositories import SubdivisionRepository
+from tests.recording_session import RecordingSession
+
+
+def test_rewrite_subtree_path_is_one_company_scoped_update() -> None:
+    session = RecordingSession()
+    company_id = uuid.uuid4()
+    asyncio.run(SubdivisionRepository(session).rewrite_subtree_path(company_id, Ltree('a.b'), Ltree('a.c')))
+
+    assert len(session.statements) == 1
+    compiled = session.compiled()
+    sql = str(compiled)
+    assert sql.startswith('UPDATE subdivision SET path')
+    assert 'WHERE company_id = ' in sql
+    assert 'path <@ ' in sql
+    assert compiled.construct_params() == {'company_id': company_id, 'old_path': 'a.b', 'new_path': 'a.c'}
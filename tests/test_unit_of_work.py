@@ -0,0 +1,60 @@
+import asyncio
+from typing import ClassVar
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from src.config import settings
+from src.utils.unit_of_work import UnitOfWork, retry_on_conflict, transaction_mode
+
+
+class SerializationFailureError(Exception):
+    sqlstate = '40001'
+
+
+class ConflictingSession:
+    """Session whose first ``commit`` fails with a serialization failure."""
+
+    instances: ClassVar[list['ConflictingSession']] = []
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.instances.append(self)
+
+    async def commit(self) -> None:
+        if len(self.instances) == 1:
+            statement = 'COMMIT'
+            raise DBAPIError(statement, None, SerializationFailureError())
+
+    async def rollback(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class Service:
+    def __init__(self) -> None:
+        self.uow = UnitOfWork()
+        self.uow.session_factory = ConflictingSession
+        self.committed: list[int] = []
+
+    @retry_on_conflict
+    @transaction_mode
+    async def save(self) -> int:
+        attempt = len(ConflictingSession.instances)
+        self.uow.add_after_commit(lambda: self.committed.append(attempt))
+        return attempt
+
+
+def test_commit_conflict_closes_session_and_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.transaction_retry, 'base_delay_seconds', 0)
+    monkeypatch.setattr(ConflictingSession, 'instances', [])
+    service = Service()
+
+    result = asyncio.run(service.save())
+
+    assert result == len(ConflictingSession.instances)
+    assert all(session.closed for session in ConflictingSession.instances)
+    assert service.committed == [result]
+    assert not service.uow.is_open
@@ -0,0 +1,42 @@
+import asyncio
+import uuid
+
+import pytest
+
+from src.repositories import UserRepository
+from src.schemas.user import UserFilters
+from tests.recording_session import RecordingSession
+
+
+def search(like: str) -> str:
+    filters = UserFilters(
+        page=None,
+        per_page=10,
+        cursor=None,
+        with_total=False,
+        like=like,
+        ids=None,
+        first_name=None,
+        last_name=None,
+        middle_name=None,
+    )
+    session = RecordingSession()
+    asyncio.run(UserRepository(session).get_users_by_filter(filters, uuid.uuid4()))
+    return str(session.compiled())
+
+
+@pytest.mark.parametrize('like', ['a', 'ab'])
+def test_short_search_term_is_substring_filter_in_keyset_order(like: str) -> None:
+    sql = search(like)
+
+    assert 'ILIKE' in sql
+    assert 'similarity(' not in sql
+    assert '"user".username % ' not in sql
+    assert 'ORDER BY "user".last_name, "user".first_name, "user".id' in sql
+
+
+def test_search_term_of_trigram_length_is_fuzzy_and_ranked() -> None:
+    sql = search('abc')
+
+    assert '"user".username % ' in sql
+    assert 'ORDER BY greatest(similarity(' in sql